@@ -61,23 +61,18 @@ def simple_table_format(
                 max_width = max(max_width, len(str(row[i])))
         col_widths.append(max_width + 2)
 
-    lines: list[str] = []
-
-    header_line = "|"
-    separator_line = "|"
-    for header, width in zip(headers, col_widths, strict=False):
-        header_line += f" {str(header):<{width - 1}}|"
-        separator_line += "-" * width + "|"
-
-    lines.append(header_line)
-    lines.append(separator_line)
+    # Build each line from its cells and join once rather than growing strings with +=
+    lines: list[str] = [
+        "|" + "".join(f" {str(header):<{width - 1}}|" for header, width in zip(headers, col_widths, strict=False)),
+        "|" + "".join("-" * width + "|" for width in col_widths),
+    ]
 
     for row in rows:
-        row_line = "|"
+        cells = []
         for i, value in enumerate(row):
             width = col_widths[i] if i < len(col_widths) else _DEFAULT_COLUMN_WIDTH
-            row_line += f" {str(value):<{width - 1}}|"
-        lines.append(row_line)
+            cells.append(f" {str(value):<{width - 1}}|")
+        lines.append("|" + "".join(cells))
 
     return "\n".join(lines)
 
@@ -34,6 +34,20 @@ __all__ = ["load_config", "load_json_config", "save_config", "get_default_config
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 VALID_SECURITY_LEVELS = {"strict", "normal", "permissive"}
 
+# Environment variable values treated as boolean true
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes", "on"})
+
+# Default configuration template; copied by get_default_config() so callers can mutate freely
+_DEFAULT_CONFIG: dict[str, Any] = {
+    "database_url": "sqlite:///:memory:",
+    "max_statements_per_file": DEFAULT_MAX_STATEMENTS_PER_FILE,
+    "connection_timeout": DEFAULT_CONNECTION_TIMEOUT,
+    "log_level": DEFAULT_LOG_LEVEL,
+    "security_level": "normal",
+    "enable_verbose": False,
+    "enable_debug": False,
+}
+
 
 def load_config(config_file_path: str | None = None) -> dict[str, Any]:
     """
@@ -76,15 +90,7 @@ def get_default_config() -> dict[str, Any]:
         max_statements_per_file, connection_timeout, log_level, security_level,
         enable_verbose, and enable_debug.
     """
-    return {
-        "database_url": "sqlite:///:memory:",
-        "max_statements_per_file": DEFAULT_MAX_STATEMENTS_PER_FILE,
-        "connection_timeout": DEFAULT_CONNECTION_TIMEOUT,
-        "log_level": DEFAULT_LOG_LEVEL,
-        "security_level": "normal",
-        "enable_verbose": False,
-        "enable_debug": False,
-    }
+    return _DEFAULT_CONFIG.copy()
 
 
 def get_env_config() -> dict[str, Any]:
@@ -124,10 +130,10 @@ def get_env_config() -> dict[str, Any]:
 
     # Output options
     if verbose := os.getenv("SPLURGE_SQL_RUNNER_VERBOSE"):
-        config["enable_verbose"] = verbose.lower() in ("true", "1", "yes", "on")
+        config["enable_verbose"] = verbose.lower() in _TRUTHY_ENV_VALUES
 
     if debug := os.getenv("SPLURGE_SQL_RUNNER_DEBUG"):
-        config["enable_debug"] = debug.lower() in ("true", "1", "yes", "on")
+        config["enable_debug"] = debug.lower() in _TRUTHY_ENV_VALUES
 
     return config
 
@@ -190,7 +196,7 @@ def _parse_json_config(config_data: dict[str, Any]) -> dict[str, Any]:
     # Security configuration
     if "security_level" in config_data:
         security_level = config_data["security_level"]
-        if security_level in ["strict", "normal", "permissive"]:
+        if isinstance(security_level, str) and security_level in VALID_SECURITY_LEVELS:
             config["security_level"] = security_level
 
     return config
@@ -111,6 +111,8 @@ class ContextualLogger:
     Allows adding contextual data that will be included in all log messages.
     """
 
+    __slots__ = ("_logger", "_custom_name", "_context")
+
     # type of the contextual data stored on this logger
     _context: dict[str, Any]
 
@@ -201,6 +203,8 @@ class LogContext:
     Context manager and decorator for temporary contextual logging.
     """
 
+    __slots__ = ("_context", "_contextual_logger")
+
     def __init__(self, **context: Any) -> None:
         """
         Initialize log context.
@@ -30,6 +30,8 @@ class PerformanceLogger:
     Logger for performance monitoring and timing.
     """
 
+    __slots__ = ("_logger",)
+
     def __init__(self, logger: logging.Logger) -> None:
         """
         Initialize performance logger.
@@ -76,12 +78,12 @@ class PerformanceLogger:
         def decorator(func: Callable[P, T]) -> Callable[P, T]:
             @wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     self.log_timing(operation, duration, **context)
 
             return wrapper
@@ -109,12 +111,12 @@ def log_performance(operation: str, **context: Any) -> Callable[[Callable[P, T]]
             logger = get_logger()
             perf_logger = PerformanceLogger(logger)
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 perf_logger.log_timing(operation, duration, **context)
 
         return wrapper
@@ -139,9 +141,9 @@ def performance_context(operation: str, **context: Any) -> Any:
     logger = get_logger()
     perf_logger = PerformanceLogger(logger)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         yield perf_logger
     finally:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         perf_logger.log_timing(operation, duration, **context)
@@ -76,7 +76,13 @@ def process_sql(
 
         sql_stmts = parse_sql_statements(sql_content, strip_semicolon=False)
 
-        SecurityValidator.validate_sql_content("\n".join(sql_stmts), security_level, max_statements_per_file)
+        # Statements are already split, so pass the count instead of re-parsing the joined text
+        SecurityValidator.validate_sql_content(
+            "\n".join(sql_stmts),
+            security_level,
+            max_statements_per_file,
+            statement_count=len(sql_stmts),
+        )
 
         db_client = DatabaseClient(database_url=database_url, connection_timeout=config.get("connection_timeout", 30.0))
 
@@ -169,9 +175,10 @@ def process_sql_files(
                 )
 
                 summary["files_processed"] += 1
-                # Count success if none of the statement results are error
-                batch_passed = all(r.get("statement_type") != "error" for r in results)
-                batch_failed = all(r.get("statement_type") == "error" for r in results)
+                # Classify the batch from a single pass over the statement results
+                error_count = sum(1 for r in results if r.get("statement_type") == "error")
+                batch_passed = error_count == 0
+                batch_failed = error_count == len(results)
                 if batch_passed:
                     summary["files_passed"] += 1
                 elif batch_failed:
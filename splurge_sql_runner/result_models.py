@@ -12,7 +12,7 @@ This module is licensed under the MIT License.
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -30,10 +30,12 @@ class StatementType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatementResult:
     """Typed representation of a single statement execution result.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a modified copy.
+
     Attributes:
         statement: The SQL text of the executed statement.
         statement_type: Type of the statement result.
@@ -62,19 +64,20 @@ def statement_result_to_dict(result: StatementResult) -> dict[str, Any]:
         row_count (optional), file_path (optional). The structure matches the
         format returned by DatabaseClient.execute_sql() for backward compatibility.
     """
-    data = asdict(result)
-    # Map enum to its value for JSON/legacy compatibility
-    data["statement_type"] = result.statement_type.value
-    # Keep keys order similar to legacy for readability
-    ordered = {
-        "statement": data["statement"],
-        "statement_type": data["statement_type"],
+    # Build the legacy layout straight from the fields instead of via ``asdict``.
+    # Fetched rows are copied one level deep so callers editing the output cannot
+    # reach into the frozen result.
+    ordered: dict[str, Any] = {
+        "statement": result.statement,
+        # Map enum to its value for JSON/legacy compatibility
+        "statement_type": result.statement_type.value,
     }
     if result.statement_type == StatementType.ERROR:
-        ordered["error"] = data.get("error")
+        ordered["error"] = result.error
     else:
-        ordered["result"] = data.get("result")
-        ordered["row_count"] = data.get("row_count")
+        rows = result.result
+        ordered["result"] = [dict(row) for row in rows] if isinstance(rows, list) else rows
+        ordered["row_count"] = result.row_count
     if result.file_path:
         ordered["file_path"] = result.file_path
     return ordered
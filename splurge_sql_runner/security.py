@@ -8,6 +8,8 @@ Copyright (c) 2025, Jim Schilling
 This module is licensed under the MIT License.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from .exceptions import (
@@ -21,12 +23,31 @@ DOMAINS = ["security", "validation"]
 __all__ = ["SecurityValidator"]
 
 
+@lru_cache(maxsize=32)
+def _case_folded(patterns: tuple[str, ...], fold: Callable[[str], str]) -> tuple[tuple[str, str], ...]:
+    """
+    Pair each pattern with its case-folded form.
+
+    Results are cached per pattern tuple, so each level's patterns are folded once,
+    and reassigning a level's patterns takes effect on the next validation.
+
+    Args:
+        patterns: Patterns from one of the public pattern sets
+        fold: Case-folding function (``str.lower`` or ``str.upper``)
+
+    Returns:
+        tuple: (pattern, folded pattern) pairs
+    """
+    return tuple((pattern, fold(pattern)) for pattern in patterns)
+
+
 class SecurityValidator:
     """Risk-based security validation utilities."""
 
-    # Security patterns by level
-    STRICT_PATTERNS = {
-        "dangerous_paths": [
+    # Security patterns by level. Pattern collections are immutable tuples so the
+    # shared instance for each level cannot be changed in place.
+    STRICT_PATTERNS: dict[str, tuple[str, ...]] = {
+        "dangerous_paths": (
             "..",
             "~",
             "/etc",
@@ -38,8 +59,8 @@ class SecurityValidator:
             "\\windows\\system32",
             "\\windows\\syswow64",
             "\\program files",
-        ],
-        "dangerous_sql": [
+        ),
+        "dangerous_sql": (
             "DROP DATABASE",
             "TRUNCATE DATABASE",
             "DELETE FROM INFORMATION_SCHEMA",
@@ -54,17 +75,21 @@ class SecurityValidator:
             "RESTORE DATABASE",
             "SHUTDOWN",
             "KILL",
-        ],
-        "dangerous_urls": ["--", "/*", "*/", "xp_", "sp_", "exec", "execute", "script:", "javascript:", "data:"],
+        ),
+        "dangerous_urls": ("--", "/*", "*/", "xp_", "sp_", "exec", "execute", "script:", "javascript:", "data:"),
     }
 
-    NORMAL_PATTERNS = {
-        "dangerous_paths": ["..", "~", "/etc", "/var", "\\windows\\system32"],
-        "dangerous_sql": ["DROP DATABASE", "EXEC ", "EXECUTE ", "XP_", "SP_"],
-        "dangerous_urls": ["script:", "javascript:", "data:"],
+    NORMAL_PATTERNS: dict[str, tuple[str, ...]] = {
+        "dangerous_paths": ("..", "~", "/etc", "/var", "\\windows\\system32"),
+        "dangerous_sql": ("DROP DATABASE", "EXEC ", "EXECUTE ", "XP_", "SP_"),
+        "dangerous_urls": ("script:", "javascript:", "data:"),
     }
 
-    PERMISSIVE_PATTERNS = {"dangerous_paths": [".."], "dangerous_sql": [], "dangerous_urls": []}
+    PERMISSIVE_PATTERNS: dict[str, tuple[str, ...]] = {
+        "dangerous_paths": ("..",),
+        "dangerous_sql": (),
+        "dangerous_urls": (),
+    }
 
     @staticmethod
     def validate_database_url(database_url: str, security_level: str = "normal") -> None:
@@ -96,15 +121,21 @@ class SecurityValidator:
             raise SplurgeSqlRunnerValueError("Database URL must include a scheme (e.g., sqlite://, postgresql://)")
 
         # Check patterns based on security level
-        patterns = SecurityValidator._get_patterns(security_level)["dangerous_urls"]
+        patterns = SecurityValidator._get_patterns(security_level)
         url_lower = database_url.lower()
 
-        for pattern in patterns:
-            if pattern.lower() in url_lower:
+        for pattern, pattern_lower in _case_folded(tuple(patterns["dangerous_urls"]), str.lower):
+            if pattern_lower in url_lower:
                 raise SplurgeSqlRunnerSecurityError(f"Database URL contains dangerous pattern: {pattern}")
 
     @staticmethod
-    def validate_sql_content(sql_content: str, security_level: str = "normal", max_statements: int = 100) -> None:
+    def validate_sql_content(
+        sql_content: str,
+        security_level: str = "normal",
+        max_statements: int = 100,
+        *,
+        statement_count: int | None = None,
+    ) -> None:
         """
         Validate SQL content for security concerns.
 
@@ -112,6 +143,8 @@ class SecurityValidator:
             sql_content: SQL content to validate
             security_level: Security level ("strict", "normal", "permissive")
             max_statements: Maximum allowed statements
+            statement_count: Number of statements in sql_content when the caller has
+                already parsed it; if None, sql_content is parsed to count them
 
         Raises:
             SplurgeSqlRunnerSecurityError: If SQL contains dangerous pattern
@@ -125,25 +158,26 @@ class SecurityValidator:
             return  # Skip validation for permissive mode
 
         # Check dangerous SQL patterns
-        patterns = SecurityValidator._get_patterns(security_level)["dangerous_sql"]
+        patterns = SecurityValidator._get_patterns(security_level)
         sql_upper = sql_content.upper()
 
-        for pattern in patterns:
-            if pattern.upper() in sql_upper:
+        for pattern, pattern_upper in _case_folded(tuple(patterns["dangerous_sql"]), str.upper):
+            if pattern_upper in sql_upper:
                 raise SplurgeSqlRunnerSecurityError(f"SQL content contains dangerous pattern: {pattern}")
 
         # Check statement count (only for strict/normal modes)
         if security_level in ("strict", "normal"):
-            from .sql_helper import parse_sql_statements
+            if statement_count is None:
+                from .sql_helper import parse_sql_statements
 
-            statements = parse_sql_statements(sql_content)
-            if len(statements) > max_statements:
+                statement_count = len(parse_sql_statements(sql_content))
+            if statement_count > max_statements:
                 raise SplurgeSqlRunnerSecurityError(
-                    f"Too many SQL statements ({len(statements)}). Maximum allowed: {max_statements}"
+                    f"Too many SQL statements ({statement_count}). Maximum allowed: {max_statements}"
                 )
 
     @staticmethod
-    def _get_patterns(security_level: str) -> dict:
+    def _get_patterns(security_level: str) -> dict[str, tuple[str, ...]]:
         """
         Get security patterns for the specified level.
 
@@ -156,6 +190,7 @@ class SecurityValidator:
         Raises:
             SplurgeSqlRunnerValueError: If unsupported security level is provided
         """
+        # Read the class attributes on every call so reassigned pattern sets are enforced
         if security_level == "strict":
             return SecurityValidator.STRICT_PATTERNS
         elif security_level == "normal":
@@ -20,16 +20,21 @@ DOMAINS = ["sql", "parsing", "helpers"]
 __all__ = ["parse_sql_statements", "detect_statement_type"]
 
 # Private constants for SQL statement types
-_FETCH_KEYWORDS: set[str] = {
-    "SELECT",
-    "VALUES",
-    "SHOW",
-    "EXPLAIN",
-    "PRAGMA",
-    "DESC",
-    "DESCRIBE",
-}
-_MODIFY_DML_KEYWORDS: set[str] = {"INSERT", "UPDATE", "DELETE"}
+_FETCH_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "SELECT",
+        "VALUES",
+        "SHOW",
+        "EXPLAIN",
+        "PRAGMA",
+        "DESC",
+        "DESCRIBE",
+    }
+)
+_MODIFY_DML_KEYWORDS: frozenset[str] = frozenset({"INSERT", "UPDATE", "DELETE"})
+_DESCRIBE_KEYWORDS: frozenset[str] = frozenset({"DESC", "DESCRIBE"})
+# Keywords that may start the main statement following CTE definitions
+_MAIN_STATEMENT_KEYWORDS: frozenset[str] = _FETCH_KEYWORDS | _MODIFY_DML_KEYWORDS
 
 # Private constants for SQL keywords and symbols
 _WITH_KEYWORD: str = "WITH"
@@ -192,7 +197,7 @@ def find_main_statement_after_with(tokens: list[Token]) -> str | None:
         return None
 
     token_value = normalize_token(token)
-    if token_value in _MODIFY_DML_KEYWORDS or token_value in _FETCH_KEYWORDS:
+    if token_value in _MAIN_STATEMENT_KEYWORDS:
         return token_value
     return None
 
@@ -296,7 +301,7 @@ def detect_statement_type(sql: str) -> str:
     token_value = normalize_token(first_token)
 
     # DESC/DESCRIBE detection (regardless of token type)
-    if token_value in ("DESC", "DESCRIBE"):
+    if token_value in _DESCRIBE_KEYWORDS:
         return FETCH_STATEMENT
 
     # CTE detection: WITH ...
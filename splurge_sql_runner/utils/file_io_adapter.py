@@ -41,6 +41,9 @@ CONTEXT_MESSAGES = {
 # Maximum file size before warning (in MB)
 MAX_FILE_SIZE_MB = 500
 
+# Bytes per megabyte, used to express size limits in bytes
+_BYTES_PER_MB = 1024 * 1024
+
 
 class FileIoAdapter:
     """Adapter for safe file I/O with domain error translation.
@@ -217,9 +220,10 @@ class FileIoAdapter:
         """
         try:
             size_bytes = Path(file_path).stat().st_size
-            size_mb = size_bytes / (1024 * 1024)
+            size_mb = size_bytes / _BYTES_PER_MB
 
-            if size_mb > max_size_mb:
+            # Compare in bytes against the limit rather than in derived megabytes
+            if size_bytes > max_size_mb * _BYTES_PER_MB:
                 msg = f"File too large: {size_mb:.1f}MB (max: {max_size_mb}MB)"
                 logger.warning(msg)
                 raise SplurgeSqlRunnerFileError(
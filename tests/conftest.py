@@ -6,8 +6,6 @@ This module provides common test fixtures and configuration for all test modules
 
 import json
 import logging
-import os
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -19,40 +17,43 @@ TEST_DATA_DIR = Path(__file__).parent / "test_data"
 TEST_CONFIG_DIR = Path(__file__).parent / "test_configs"
 TEST_SQL_DIR = Path(__file__).parent / "test_sql"
 
-# Ensure test directories exist
-TEST_DATA_DIR.mkdir(exist_ok=True)
-TEST_CONFIG_DIR.mkdir(exist_ok=True)
-TEST_SQL_DIR.mkdir(exist_ok=True)
-
 
 @pytest.fixture(scope="session")
 def test_data_dir() -> Path:
-    """Provide the test data directory path."""
+    """Provide the test data directory path, creating it on first use."""
+    TEST_DATA_DIR.mkdir(exist_ok=True)
     return TEST_DATA_DIR
 
 
 @pytest.fixture(scope="session")
 def test_config_dir() -> Path:
-    """Provide the test configuration directory path."""
+    """Provide the test configuration directory path, creating it on first use."""
+    TEST_CONFIG_DIR.mkdir(exist_ok=True)
     return TEST_CONFIG_DIR
 
 
 @pytest.fixture(scope="session")
 def test_sql_dir() -> Path:
-    """Provide the test SQL directory path."""
+    """Provide the test SQL directory path, creating it on first use."""
+    TEST_SQL_DIR.mkdir(exist_ok=True)
     return TEST_SQL_DIR
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Provide a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_dir(tmp_path: Path) -> Path:
+    """Provide a per-test temporary directory for files a test may modify."""
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def shared_sample_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a session-wide directory for read-only sample files."""
+    return tmp_path_factory.mktemp("samples")
+
+
+@pytest.fixture(scope="session")
 def sample_config_data() -> dict[str, Any]:
-    """Provide sample configuration data for testing."""
+    """Provide sample configuration data for testing (shared; treat as read-only)."""
     return {
         "database_url": "sqlite:///:memory:",
         "max_statements_per_file": 100,
@@ -64,7 +65,7 @@ def sample_config_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sql_content() -> str:
     """Provide sample SQL content for testing."""
     return """
@@ -76,87 +77,64 @@ SELECT 'hello' as greeting;
 """
 
 
-@pytest.fixture
-def sample_sql_file(temp_dir: Path, sample_sql_content: str) -> Path:
-    """Provide a temporary SQL file with sample content."""
-    sql_file = temp_dir / "test.sql"
+@pytest.fixture(scope="session")
+def sample_sql_file(shared_sample_dir: Path, sample_sql_content: str) -> Path:
+    """Provide a read-only SQL file with sample content, written once per session."""
+    sql_file = shared_sample_dir / "test.sql"
     sql_file.write_text(sample_sql_content)
     return sql_file
 
 
-@pytest.fixture
-def sample_config_file(temp_dir: Path, sample_config_data: dict[str, Any]) -> Path:
-    """Provide a temporary config file with sample data."""
-    config_file = temp_dir / "test_config.json"
-    with open(config_file, "w") as f:
-        json.dump(sample_config_data, f, indent=2)
+@pytest.fixture(scope="session")
+def sample_config_file(shared_sample_dir: Path, sample_config_data: dict[str, Any]) -> Path:
+    """Provide a read-only config file with sample data, written once per session."""
+    config_file = shared_sample_dir / "test_config.json"
+    config_file.write_text(json.dumps(sample_config_data, indent=2))
     return config_file
 
 
-@pytest.fixture(autouse=True)
-def reset_logging():
-    """Reset logging configuration before each test."""
-    # Clear any existing handlers
+@pytest.fixture(scope="session", autouse=True)
+def _baseline_logging() -> tuple[list[logging.Handler], int]:
+    """Configure basic root logging once and record it as the per-test baseline."""
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-
-    # Reset to basic configuration
     logging.basicConfig(level=logging.WARNING)
-
-    yield
-
-    # Cleanup after test
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    return root_logger.handlers[:], root_logger.level
 
 
 @pytest.fixture(autouse=True)
-def reset_environment():
-    """Reset environment variables before each test."""
-    # Store original environment
-    original_env = os.environ.copy()
-
-    yield
-
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-# Integration and E2E specific fixtures
-
-
-@pytest.fixture(scope="session")
-def integration_test_db_path(tmp_path_factory):
-    """Create a temporary database file for integration tests."""
-    return tmp_path_factory.mktemp("integration_db") / "integration.db"
+def reset_logging(_baseline_logging: tuple[list[logging.Handler], int]) -> Generator[None, None, None]:
+    """Restore the baseline root logging configuration around each test.
 
+    Handlers and level are only reassigned when a test actually changed them.
+    """
+    baseline_handlers, baseline_level = _baseline_logging
+    root_logger = logging.getLogger()
 
-@pytest.fixture(scope="session")
-def e2e_test_db_path(tmp_path_factory):
-    """Create a temporary database file for e2e tests."""
-    return tmp_path_factory.mktemp("e2e_db") / "e2e.db"
+    def _restore() -> None:
+        if root_logger.handlers != baseline_handlers:
+            root_logger.handlers[:] = baseline_handlers
+        if root_logger.level != baseline_level:
+            root_logger.setLevel(baseline_level)
 
+    _restore()
+    yield
+    _restore()
 
-@pytest.fixture
-def integration_db_client(integration_test_db_path):
-    """Database client fixture for integration tests."""
-    from splurge_sql_runner.database.database_client import DatabaseClient
 
-    client = DatabaseClient(database_url=f"sqlite:///{integration_test_db_path}")
-    yield client
-    client.close()
+@pytest.fixture(autouse=True)
+def reset_environment(monkeypatch: pytest.MonkeyPatch) -> Generator[pytest.MonkeyPatch, None, None]:
+    """Restore environment variables changed during a test.
 
+    Tests should change the environment through ``monkeypatch.setenv``/``delenv``
+    (or ``patch.dict(os.environ, ...)``); only the variables touched that way are
+    reverted, instead of snapshotting and rebuilding all of ``os.environ``.
+    """
+    yield monkeypatch
 
-@pytest.fixture
-def e2e_db_client(e2e_test_db_path):
-    """Database client fixture for e2e tests."""
-    from splurge_sql_runner.database.database_client import DatabaseClient
 
-    client = DatabaseClient(database_url=f"sqlite:///{e2e_test_db_path}")
-    yield client
-    client.close()
+# Shared file factory fixtures
 
 
 @pytest.fixture
@@ -177,102 +155,8 @@ def temp_config_file_factory(tmp_path):
 
     def _create_config_file(config_data: dict, filename: str = "config.json") -> Path:
         config_file = tmp_path / filename
-        with open(config_file, "w") as f:
-            json.dump(config_data, f, indent=2)
+        # Serialize in one shot: json.dump issues a separate write per encoded chunk
+        config_file.write_text(json.dumps(config_data, indent=2))
         return config_file
 
     return _create_config_file
-
-
-@pytest.fixture
-def in_memory_db_client():
-    """Fast in-memory database client for unit tests."""
-    from splurge_sql_runner.database.database_client import DatabaseClient
-
-    client = DatabaseClient(database_url="sqlite:///:memory:")
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def temp_db_client(tmp_path):
-    """Temporary file-based database client for tests needing persistence."""
-    from splurge_sql_runner.database.database_client import DatabaseClient
-
-    db_path = tmp_path / "test.db"
-    client = DatabaseClient(database_url=f"sqlite:///{db_path}")
-    yield client
-    client.close()
-
-
-@pytest.fixture
-def complex_test_data():
-    """Complex test data for integration testing."""
-    return {
-        "users": [
-            {"id": 1, "name": "Alice Johnson", "email": "alice@example.com", "department": "Engineering"},
-            {"id": 2, "name": "Bob Smith", "email": "bob@example.com", "department": "Sales"},
-            {"id": 3, "name": "Charlie Brown", "email": "charlie@example.com", "department": "Engineering"},
-        ],
-        "orders": [
-            {"id": 1, "user_id": 1, "amount": 99.99, "status": "completed"},
-            {"id": 2, "user_id": 1, "amount": 149.50, "status": "pending"},
-            {"id": 3, "user_id": 2, "amount": 75.00, "status": "completed"},
-        ],
-    }
-
-
-@pytest.fixture
-def sample_complex_sql(complex_test_data):
-    """Generate complex SQL for testing."""
-    sql_parts = []
-
-    # Create tables
-    sql_parts.append("""
-    CREATE TABLE users (
-        id INTEGER PRIMARY KEY,
-        name TEXT NOT NULL,
-        email TEXT UNIQUE,
-        department TEXT
-    );
-
-    CREATE TABLE orders (
-        id INTEGER PRIMARY KEY,
-        user_id INTEGER,
-        amount REAL,
-        status TEXT,
-        FOREIGN KEY (user_id) REFERENCES users(id)
-    );
-    """)
-
-    # Insert users
-    user_inserts = []
-    for user in complex_test_data["users"]:
-        user_inserts.append(
-            f"INSERT INTO users (id, name, email, department) VALUES ({user['id']}, '{user['name']}', '{user['email']}', '{user['department']}');"
-        )
-    sql_parts.append("\n".join(user_inserts))
-
-    # Insert orders
-    order_inserts = []
-    for order in complex_test_data["orders"]:
-        order_inserts.append(
-            f"INSERT INTO orders (id, user_id, amount, status) VALUES ({order['id']}, {order['user_id']}, {order['amount']}, '{order['status']}');"
-        )
-    sql_parts.append("\n".join(order_inserts))
-
-    # Complex query
-    sql_parts.append("""
-    SELECT
-        u.name,
-        u.department,
-        COUNT(o.id) as order_count,
-        ROUND(SUM(o.amount), 2) as total_amount,
-        AVG(o.amount) as avg_order_amount
-    FROM users u
-    LEFT JOIN orders o ON u.id = o.user_id
-    GROUP BY u.id, u.name, u.department
-    ORDER BY total_amount DESC NULLS LAST;
-    """)
-
-    return "\n\n".join(sql_parts)
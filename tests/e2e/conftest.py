@@ -0,0 +1,33 @@
+"""
+Pytest fixtures for splurge-sql-runner end-to-end tests.
+
+Database fixtures used only by the e2e suite.
+"""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def e2e_test_db_path(tmp_path_factory):
+    """Create a temporary database file for e2e tests."""
+    return tmp_path_factory.mktemp("e2e_db") / "e2e.db"
+
+
+@pytest.fixture(scope="session")
+def e2e_db_client(e2e_test_db_path):
+    """Database client for e2e tests, sharing one engine per session."""
+    from splurge_sql_runner.database.database_client import DatabaseClient
+
+    client = DatabaseClient(database_url=f"sqlite:///{e2e_test_db_path}")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def e2e_scratch_table(e2e_db_client):
+    """Unique table name in the shared e2e database, dropped after the test."""
+    table = f"scratch_{uuid.uuid4().hex[:12]}"
+    yield table
+    e2e_db_client.execute_sql([f"DROP TABLE IF EXISTS {table};"])
@@ -266,8 +266,7 @@ class TestCLIWorkflowE2E:
             "security": {"validate_sql": True, "allowed_commands": ["SELECT", "INSERT", "CREATE"]},
         }
 
-        with open(config_file, "w") as f:
-            json.dump(config_data, f, indent=2)
+        config_file.write_text(json.dumps(config_data, indent=2))
 
         # Create SQL file
         sql_file = tmp_path / "config_test.sql"
@@ -406,10 +405,9 @@ class TestCLIWorkflowE2E:
 
         # Create data file with multiple inserts
         data_file = tmp_path / "large_data.sql"
-        inserts = []
-        for i in range(100):  # Create 100 inserts
-            inserts.append(f"INSERT INTO large_test (data, number) VALUES ('data_{i}', {i});")
-        data_file.write_text("\n".join(inserts))
+        data_file.write_text(  # 100 inserts built and written in one call
+            "\n".join(f"INSERT INTO large_test (data, number) VALUES ('data_{i}', {i});" for i in range(100))
+        )
 
         # Create query file
         query_file = tmp_path / "large_query.sql"
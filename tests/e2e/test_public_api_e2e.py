@@ -5,6 +5,7 @@ Tests programmatic APIs (process_sql, process_sql_files, DatabaseClient)
 using real SQLite databases and actual data to validate expected behavior.
 """
 
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
@@ -15,6 +16,22 @@ from splurge_sql_runner.exceptions import (
 )
 from splurge_sql_runner.main import process_sql, process_sql_files
 
+# Product catalogue seeded by the SELECT test; expected rows are derived from it
+_PRODUCTS = [
+    {"name": "Laptop", "price": 999.99, "category": "Electronics"},
+    {"name": "Mouse", "price": 29.99, "category": "Electronics"},
+    {"name": "Desk", "price": 199.99, "category": "Furniture"},
+    {"name": "Chair", "price": 149.99, "category": "Furniture"},
+]
+_PRODUCT_ROWS = ",\n".join(f"('{p['name']}', {p['price']}, '{p['category']}')" for p in _PRODUCTS)
+
+
+def _assert_row_count(database_url: str, table: str, expected: int, where: str = "") -> None:
+    """Read back ``COUNT(*)`` from ``table`` through process_sql and compare it to ``expected``."""
+    sql = f"SELECT COUNT(*) as count FROM {table}" + (f" WHERE {where}" if where else "") + ";"
+    results = process_sql(sql, database_url=database_url)
+    assert results[0]["result"][0]["count"] == expected
+
 
 class TestProcessSqlE2E:
     """End-to-end tests for process_sql() API with real databases."""
@@ -72,11 +89,9 @@ class TestProcessSqlE2E:
                 category TEXT
             );
             INSERT INTO products (name, price, category) VALUES
-                ('Laptop', 999.99, 'Electronics'),
-                ('Mouse', 29.99, 'Electronics'),
-                ('Desk', 199.99, 'Furniture'),
-                ('Chair', 149.99, 'Furniture');
-            """,
+            """
+            + _PRODUCT_ROWS
+            + ";",
             database_url=database_url,
         )
 
@@ -91,19 +106,12 @@ class TestProcessSqlE2E:
             database_url=database_url,
         )
 
+        expected = sorted((p for p in _PRODUCTS if p["price"] > 100), key=lambda p: p["price"], reverse=True)
+
         assert len(results) == 1
         assert results[0]["statement_type"] == "fetch"
-        assert results[0]["row_count"] == 3
-
-        result_data = results[0]["result"]
-        assert isinstance(result_data, list)
-        assert len(result_data) == 3
-
-        # Verify data integrity
-        assert result_data[0]["name"] == "Laptop"
-        assert result_data[0]["price"] == 999.99
-        assert result_data[1]["name"] == "Desk"
-        assert result_data[2]["name"] == "Chair"
+        assert results[0]["row_count"] == len(expected)
+        assert results[0]["result"] == expected
 
     def test_process_sql_update_and_delete(self, test_db_path: Path) -> None:
         """Test process_sql with UPDATE and DELETE statements."""
@@ -139,11 +147,7 @@ class TestProcessSqlE2E:
         assert results[0]["row_count"] == 1
 
         # Verify update
-        verify_results = process_sql(
-            "SELECT COUNT(*) as count FROM orders WHERE status = 'completed';",
-            database_url=database_url,
-        )
-        assert verify_results[0]["result"][0]["count"] == 2
+        _assert_row_count(database_url, "orders", 2, where="status = 'completed'")
 
         # Delete
         results = process_sql(
@@ -158,11 +162,7 @@ class TestProcessSqlE2E:
         assert results[0]["row_count"] == 1
 
         # Verify delete
-        verify_results = process_sql(
-            "SELECT COUNT(*) as count FROM orders;",
-            database_url=database_url,
-        )
-        assert verify_results[0]["result"][0]["count"] == 2
+        _assert_row_count(database_url, "orders", 2)
 
     def test_process_sql_complex_query_with_join(self, test_db_path: Path) -> None:
         """Test process_sql with complex JOIN query."""
@@ -329,11 +329,7 @@ class TestProcessSqlE2E:
         assert results[2]["statement_type"] == "execute"
 
         # Verify valid inserts completed
-        verify = process_sql(
-            "SELECT COUNT(*) as count FROM test_error;",
-            database_url=database_url,
-        )
-        assert verify[0]["result"][0]["count"] == 2
+        _assert_row_count(database_url, "test_error", 2)
 
     def test_process_sql_security_level_validation(self, test_db_path: Path) -> None:
         """Test process_sql with different security levels."""
@@ -460,11 +456,7 @@ class TestProcessSqlFilesE2E:
         assert len(summary["results"]) == 3
 
         # Verify data was inserted
-        verify = process_sql(
-            "SELECT COUNT(*) as count FROM table_0;",
-            database_url=database_url,
-        )
-        assert verify[0]["result"][0]["count"] == 1
+        _assert_row_count(database_url, "table_0", 1)
 
     def test_process_sql_files_with_errors(self, test_db_path: Path, tmp_path: Path) -> None:
         """Test process_sql_files handles files with errors correctly."""
@@ -495,11 +487,7 @@ class TestProcessSqlFilesE2E:
         assert summary["files_mixed"] == 0
 
         # Verify valid file succeeded
-        verify = process_sql(
-            "SELECT COUNT(*) as count FROM test;",
-            database_url=database_url,
-        )
-        assert verify[0]["result"][0]["count"] == 1
+        _assert_row_count(database_url, "test", 1)
 
     def test_process_sql_files_nonexistent_file_handles_error(self, test_db_path: Path) -> None:
         """Test process_sql_files handles nonexistent files by capturing error in results."""
@@ -517,96 +505,79 @@ class TestProcessSqlFilesE2E:
 class TestDatabaseClientE2E:
     """End-to-end tests for DatabaseClient API with real databases."""
 
-    @pytest.fixture
-    def test_db_path(self, tmp_path: Path) -> Path:
-        """Create a temporary database file path."""
-        return tmp_path / "test_client_e2e.db"
-
-    def test_database_client_execute_sql_directly(self, test_db_path: Path) -> None:
-        """Test DatabaseClient.execute_sql() directly with real database."""
-        database_url = f"sqlite:///{test_db_path}"
-        client = DatabaseClient(database_url=database_url)
-
-        try:
-            # Create table
-            results = client.execute_sql(["CREATE TABLE direct_test (id INTEGER PRIMARY KEY, name TEXT);"])
-            assert len(results) == 1
-            assert results[0]["statement_type"] == "execute"
-
-            # Insert data
-            results = client.execute_sql(["INSERT INTO direct_test (name) VALUES ('test1'), ('test2');"])
-            assert results[0]["row_count"] == 2
-
-            # Query data
-            results = client.execute_sql(["SELECT * FROM direct_test ORDER BY id;"])
-            assert results[0]["statement_type"] == "fetch"
-            assert len(results[0]["result"]) == 2
-            assert results[0]["result"][0]["name"] == "test1"
-
-        finally:
-            client.close()
+    @pytest.fixture(scope="class")
+    def direct_test_setup(self, e2e_db_client: DatabaseClient) -> Generator[dict[str, list[dict]], None, None]:
+        """Create and populate ``direct_test`` once for the class, dropping it afterwards."""
+        create = e2e_db_client.execute_sql(["CREATE TABLE direct_test (id INTEGER PRIMARY KEY, name TEXT);"])
+        insert = e2e_db_client.execute_sql(["INSERT INTO direct_test (name) VALUES ('test1'), ('test2');"])
+        yield {"create": create, "insert": insert}
+        e2e_db_client.execute_sql(["DROP TABLE IF EXISTS direct_test;"])
+
+    def test_database_client_direct_setup(self, direct_test_setup: dict[str, list[dict]]) -> None:
+        """Test DatabaseClient.execute_sql() runs CREATE TABLE and reports rows from a multi-row INSERT."""
+        create, insert = direct_test_setup["create"], direct_test_setup["insert"]
+        assert create[0]["statement_type"] == "execute", create
+        assert insert[0]["statement_type"] == "execute", insert
+        assert insert[0]["row_count"] == 2
+
+    def test_database_client_direct_select(
+        self, e2e_db_client: DatabaseClient, direct_test_setup: dict[str, list[dict]]
+    ) -> None:
+        """Test DatabaseClient.execute_sql() fetches the inserted rows in order."""
+        results = e2e_db_client.execute_sql(["SELECT * FROM direct_test ORDER BY id;"])
+        assert results[0]["statement_type"] == "fetch"
+        assert [(row["id"], row["name"]) for row in results[0]["result"]] == [(1, "test1"), (2, "test2")]
 
-    def test_database_client_connection_pooling(self, test_db_path: Path) -> None:
+    def test_database_client_connection_pooling(self, e2e_db_client: DatabaseClient, e2e_scratch_table: str) -> None:
         """Test DatabaseClient handles multiple operations with connection reuse."""
-        database_url = f"sqlite:///{test_db_path}"
-        client = DatabaseClient(database_url=database_url)
+        client = e2e_db_client
+        table = e2e_scratch_table
 
-        try:
-            # Multiple operations should reuse connections
-            client.execute_sql(["CREATE TABLE pool_test (id INTEGER);"])
-            client.execute_sql(["INSERT INTO pool_test VALUES (1);"])
-            client.execute_sql(["INSERT INTO pool_test VALUES (2);"])
-            client.execute_sql(["INSERT INTO pool_test VALUES (3);"])
+        # Multiple operations should reuse connections
+        create = client.execute_sql([f"CREATE TABLE {table} (id INTEGER);"])
+        assert create[0]["statement_type"] == "execute"
+        client.execute_sql([f"INSERT INTO {table} VALUES (1);"])
+        client.execute_sql([f"INSERT INTO {table} VALUES (2);"])
+        client.execute_sql([f"INSERT INTO {table} VALUES (3);"])
 
-            results = client.execute_sql(["SELECT COUNT(*) as count FROM pool_test;"])
-            assert results[0]["result"][0]["count"] == 3
+        results = client.execute_sql([f"SELECT COUNT(*) as count FROM {table};"])
+        assert results[0]["result"][0]["count"] == 3
 
-        finally:
-            client.close()
-
-    def test_database_client_stop_on_error_false(self, test_db_path: Path) -> None:
+    def test_database_client_stop_on_error_false(self, e2e_db_client: DatabaseClient, e2e_scratch_table: str) -> None:
         """Test DatabaseClient with stop_on_error=False."""
-        database_url = f"sqlite:///{test_db_path}"
-        client = DatabaseClient(database_url=database_url)
-
-        try:
-            client.execute_sql(["CREATE TABLE error_test (id INTEGER PRIMARY KEY);"])
-
-            results = client.execute_sql(
-                [
-                    "INSERT INTO error_test (id) VALUES (1);",
-                    "INSERT INTO error_test (invalid) VALUES (2);",
-                    "INSERT INTO error_test (id) VALUES (3);",
-                ],
-                stop_on_error=False,
-            )
-
-            assert len(results) == 3
-            assert results[0]["statement_type"] == "execute"
-            assert results[1]["statement_type"] == "error"
-            assert results[2]["statement_type"] == "execute"
+        client = e2e_db_client
+        table = e2e_scratch_table
+
+        create = client.execute_sql([f"CREATE TABLE {table} (id INTEGER PRIMARY KEY);"])
+        assert create[0]["statement_type"] == "execute"
+
+        results = client.execute_sql(
+            [
+                f"INSERT INTO {table} (id) VALUES (1);",
+                f"INSERT INTO {table} (invalid) VALUES (2);",
+                f"INSERT INTO {table} (id) VALUES (3);",
+            ],
+            stop_on_error=False,
+        )
 
-        finally:
-            client.close()
+        assert len(results) == 3
+        assert results[0]["statement_type"] == "execute"
+        assert results[1]["statement_type"] == "error"
+        assert results[2]["statement_type"] == "execute"
 
-    def test_database_client_invalid_sql_raises_database_error(self, test_db_path: Path) -> None:
+    def test_database_client_invalid_sql_raises_database_error(self, e2e_db_client: DatabaseClient) -> None:
         """Test DatabaseClient properly handles invalid SQL."""
-        database_url = f"sqlite:///{test_db_path}"
-        client = DatabaseClient(database_url=database_url)
-
-        try:
-            # Invalid SQL should result in error type, not exception
-            results = client.execute_sql(
-                ["SELECT * FROM nonexistent_table;"],
-                stop_on_error=False,
-            )
+        client = e2e_db_client
 
-            assert len(results) == 1
-            assert results[0]["statement_type"] == "error"
-            assert results[0]["error"] is not None
+        # Invalid SQL should result in error type, not exception
+        results = client.execute_sql(
+            ["SELECT * FROM nonexistent_table;"],
+            stop_on_error=False,
+        )
 
-        finally:
-            client.close()
+        assert len(results) == 1
+        assert results[0]["statement_type"] == "error"
+        assert results[0]["error"] is not None
 
 
 class TestRealWorldScenariosE2E:
@@ -704,9 +675,8 @@ class TestRealWorldScenariosE2E:
         )
 
         assert results[0]["statement_type"] == "fetch"
-        assert results[0]["result"][0]["customer_name"] == "Alice"
-        assert results[0]["result"][0]["total"] == 1029.98
-        assert results[0]["result"][0]["item_count"] == 2
+        first = results[0]["result"][0]
+        assert (first["customer_name"], first["total"], first["item_count"]) == ("Alice", 1029.98, 2)
 
     def test_analytics_dashboard_queries(self, test_db_path: Path) -> None:
         """Test analytics queries similar to dashboard reporting."""
@@ -829,8 +799,4 @@ class TestRealWorldScenariosE2E:
         assert summary["files_passed"] == 4
 
         # Verify migration succeeded
-        verify = process_sql(
-            "SELECT COUNT(*) as count FROM new_data;",
-            database_url=database_url,
-        )
-        assert verify[0]["result"][0]["count"] == 3
+        _assert_row_count(database_url, "new_data", 3)
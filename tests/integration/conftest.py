@@ -0,0 +1,92 @@
+"""
+Pytest fixtures for splurge-sql-runner integration tests.
+
+Database and sample-data fixtures used only by the integration suite.
+"""
+
+import pytest
+
+_SAMPLE_SCHEMA_SQL = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        department TEXT
+    );
+
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER,
+        amount REAL,
+        status TEXT,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    );
+    """
+
+
+@pytest.fixture(scope="session")
+def integration_test_db_path(tmp_path_factory):
+    """Create a temporary database file for integration tests."""
+    return tmp_path_factory.mktemp("integration_db") / "integration.db"
+
+
+@pytest.fixture(scope="session")
+def integration_db_client(integration_test_db_path):
+    """Database client for integration tests, sharing one engine per session."""
+    from splurge_sql_runner.database.database_client import DatabaseClient
+
+    client = DatabaseClient(database_url=f"sqlite:///{integration_test_db_path}")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def complex_test_data():
+    """Complex test data for integration testing (shared; treat as read-only)."""
+    return {
+        "users": [
+            {"id": 1, "name": "Alice Johnson", "email": "alice@example.com", "department": "Engineering"},
+            {"id": 2, "name": "Bob Smith", "email": "bob@example.com", "department": "Sales"},
+            {"id": 3, "name": "Charlie Brown", "email": "charlie@example.com", "department": "Engineering"},
+        ],
+        "orders": [
+            {"id": 1, "user_id": 1, "amount": 99.99, "status": "completed"},
+            {"id": 2, "user_id": 1, "amount": 149.50, "status": "pending"},
+            {"id": 3, "user_id": 2, "amount": 75.00, "status": "completed"},
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_complex_sql(complex_test_data):
+    """Generate complex SQL for testing, built once per session."""
+    sql_parts = [_SAMPLE_SCHEMA_SQL]
+
+    # Insert users and orders as one multi-row INSERT each
+    user_rows = ",\n    ".join(
+        f"({user['id']}, '{user['name']}', '{user['email']}', '{user['department']}')"
+        for user in complex_test_data["users"]
+    )
+    sql_parts.append(f"INSERT INTO users (id, name, email, department) VALUES\n    {user_rows};")
+
+    order_rows = ",\n    ".join(
+        f"({order['id']}, {order['user_id']}, {order['amount']}, '{order['status']}')"
+        for order in complex_test_data["orders"]
+    )
+    sql_parts.append(f"INSERT INTO orders (id, user_id, amount, status) VALUES\n    {order_rows};")
+
+    # Complex query
+    sql_parts.append("""
+    SELECT
+        u.name,
+        u.department,
+        COUNT(o.id) as order_count,
+        ROUND(SUM(o.amount), 2) as total_amount,
+        AVG(o.amount) as avg_order_amount
+    FROM users u
+    LEFT JOIN orders o ON u.id = o.user_id
+    GROUP BY u.id, u.name, u.department
+    ORDER BY total_amount DESC NULLS LAST;
+    """)
+
+    return "\n\n".join(sql_parts)
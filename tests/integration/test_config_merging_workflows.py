@@ -164,24 +164,16 @@ class TestConfigurationWithDifferentSecurityLevels:
 
         config = load_config(None)
 
-        # Setup
-        process_sql_files(
-            [str(setup_file)],
-            database_url=db_url,
-            config=config,
-            security_level="permissive",
-        )
-
-        # Process with permissive
+        # Setup and the DROP file run in order within one process_sql_files batch
         summary = process_sql_files(
-            [str(sql_file)],
+            [str(setup_file), str(sql_file)],
             database_url=db_url,
             config=config,
             security_level="permissive",
         )
 
-        # Should have processed even though it's a DROP statement
-        assert summary["files_processed"] >= 1
+        # Should have processed both files even though one is a DROP statement
+        assert summary["files_processed"] == 2
 
 
 class TestMultipleConfigurationSources:
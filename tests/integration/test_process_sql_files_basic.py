@@ -56,6 +56,34 @@ SELECT * FROM nonexistent_table;
 TOO_MANY_STATEMENTS = ";".join([f"SELECT {i};" for i in range(150)])
 
 
+@pytest.fixture(scope="module")
+def read_only_sql_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of read-only SQL files written once for this module."""
+    sql_dir = tmp_path_factory.mktemp("read_only_sql")
+    (sql_dir / "unsafe.sql").write_text(UNSAFE_SQL)
+    (sql_dir / "too_many.sql").write_text(TOO_MANY_STATEMENTS)
+    (sql_dir / "empty.sql").write_text("")
+    return sql_dir
+
+
+@pytest.fixture(scope="module")
+def unsafe_sql_file(read_only_sql_dir: Path) -> Path:
+    """SQL file containing a statement blocked by strict security."""
+    return read_only_sql_dir / "unsafe.sql"
+
+
+@pytest.fixture(scope="module")
+def too_many_statements_file(read_only_sql_dir: Path) -> Path:
+    """SQL file exceeding small max_statements_per_file limits."""
+    return read_only_sql_dir / "too_many.sql"
+
+
+@pytest.fixture(scope="module")
+def empty_sql_file(read_only_sql_dir: Path) -> Path:
+    """Empty SQL file."""
+    return read_only_sql_dir / "empty.sql"
+
+
 class TestProcessSqlBasic:
     """Test basic process_sql() function with SQL content strings."""
 
@@ -78,22 +106,16 @@ class TestProcessSqlBasic:
         """Test process_sql with multi-statement content."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        # Create table first
-        process_sql(
-            SIMPLE_CREATE_TABLE,
-            database_url=db_url,
-            security_level="normal",
-        )
-
-        # Insert data
+        # Create the table and insert its rows in one batch
         result = process_sql(
-            SIMPLE_INSERT,
+            SIMPLE_CREATE_TABLE + SIMPLE_INSERT,
             database_url=db_url,
             security_level="normal",
         )
 
         assert isinstance(result, list)
-        assert len(result) >= 2
+        assert len(result) == 3
+        assert all(r["statement_type"] == "execute" for r in result)
 
     def test_process_sql_with_stop_on_error_true(self, tmp_path: Path) -> None:
         """Test that stop_on_error=True stops execution on first error."""
@@ -121,15 +143,8 @@ class TestProcessSqlBasic:
         """Test that stop_on_error=False continues after errors."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        # Create table first
-        process_sql(
-            SIMPLE_CREATE_TABLE,
-            database_url=db_url,
-            security_level="normal",
-        )
-
-        # Mix valid and invalid SQL
-        mixed_sql = "SELECT * FROM test_users; SELECT * FROM nonexistent_table;"
+        # Create the table, then mix valid and invalid SQL in the same batch
+        mixed_sql = SIMPLE_CREATE_TABLE + "SELECT * FROM test_users; SELECT * FROM nonexistent_table;"
 
         result = process_sql(
             mixed_sql,
@@ -139,7 +154,7 @@ class TestProcessSqlBasic:
         )
 
         assert isinstance(result, list)
-        assert len(result) >= 1
+        assert [r["statement_type"] for r in result] == ["execute", "fetch", "error"]
 
     def test_process_sql_with_custom_max_statements(self, tmp_path: Path) -> None:
         """Test process_sql with custom max_statements_per_file parameter."""
@@ -435,17 +450,15 @@ class TestProcessSqlFilesBasic:
 
         assert summary["files_processed"] == 1
 
-    def test_process_sql_files_respects_max_statements_per_file(self, tmp_path: Path) -> None:
+    def test_process_sql_files_respects_max_statements_per_file(
+        self, tmp_path: Path, too_many_statements_file: Path
+    ) -> None:
         """Test that process_sql_files respects max_statements_per_file limit."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        # Create file with too many statements
-        file1 = tmp_path / "file1.sql"
-        file1.write_text(TOO_MANY_STATEMENTS)
-
         with pytest.raises(SplurgeSqlRunnerSecurityError):
             process_sql_files(
-                [str(file1)],
+                [str(too_many_statements_file)],
                 database_url=db_url,
                 security_level="normal",
                 max_statements_per_file=10,
@@ -514,16 +527,13 @@ class TestProcessSqlFilesSecurityValidation:
         assert len(results) > 0
         assert any(r.get("statement_type") == "error" for r in results)
 
-    def test_process_sql_files_validates_sql_content(self, tmp_path: Path) -> None:
+    def test_process_sql_files_validates_sql_content(self, tmp_path: Path, unsafe_sql_file: Path) -> None:
         """Test that process_sql_files validates SQL content."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        sql_file = tmp_path / "test.sql"
-        sql_file.write_text(UNSAFE_SQL)
-
         with pytest.raises(SplurgeSqlRunnerSecurityError):
             process_sql_files(
-                [str(sql_file)],
+                [str(unsafe_sql_file)],
                 database_url=db_url,
                 security_level="strict",
             )
@@ -598,16 +608,13 @@ class TestProcessSqlFilesErrorHandling:
         # Should have error result
         assert any(r.get("statement_type") == "error" for r in results)
 
-    def test_process_sql_files_re_raises_security_errors(self, tmp_path: Path) -> None:
+    def test_process_sql_files_re_raises_security_errors(self, tmp_path: Path, too_many_statements_file: Path) -> None:
         """Test that SecurityValidationError is re-raised from process_sql_files."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        file_with_too_many = tmp_path / "many.sql"
-        file_with_too_many.write_text(TOO_MANY_STATEMENTS)
-
         with pytest.raises(SplurgeSqlRunnerSecurityError):
             process_sql_files(
-                [str(file_with_too_many)],
+                [str(too_many_statements_file)],
                 database_url=db_url,
                 security_level="normal",
                 max_statements_per_file=5,
@@ -687,22 +694,19 @@ class TestProcessSqlFilesEdgeCases:
         assert summary["files_processed"] == 1
         assert str(special_file) in summary["results"]
 
-    def test_process_sql_files_with_empty_sql_file(self, tmp_path: Path) -> None:
+    def test_process_sql_files_with_empty_sql_file(self, tmp_path: Path, empty_sql_file: Path) -> None:
         """Test that process_sql_files handles empty SQL files."""
         db_url = f"sqlite:///{tmp_path}/test.db"
 
-        empty_file = tmp_path / "empty.sql"
-        empty_file.write_text("")
-
         summary = process_sql_files(
-            [str(empty_file)],
+            [str(empty_sql_file)],
             database_url=db_url,
             security_level="normal",
         )
 
         # Should process without error
         assert summary["files_processed"] == 1
-        assert str(empty_file) in summary["results"]
+        assert str(empty_sql_file) in summary["results"]
 
     def test_process_sql_files_with_sql_file_containing_only_comments(self, tmp_path: Path) -> None:
         """Test process_sql_files with file containing only comments."""
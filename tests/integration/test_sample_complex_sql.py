@@ -0,0 +1,32 @@
+"""
+Integration tests for the ``sample_complex_sql`` fixture script.
+
+Runs the generated schema, multi-row INSERTs, and summary query through
+DatabaseClient against a real SQLite database.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from splurge_sql_runner.database.database_client import DatabaseClient
+from splurge_sql_runner.sql_helper import parse_sql_statements
+
+
+class TestSampleComplexSql:
+    """Test the sample complex SQL script executes and loads every row."""
+
+    def test_sample_complex_sql_loads_rows(
+        self, tmp_path: Path, sample_complex_sql: str, complex_test_data: dict[str, list[dict]]
+    ) -> None:
+        """Test each multi-row INSERT loads its table and the summary query returns one row per user."""
+        client = DatabaseClient(database_url=f"sqlite:///{tmp_path / 'complex.db'}")
+        try:
+            results = client.execute_sql(parse_sql_statements(sample_complex_sql))
+        finally:
+            client.close()
+
+        assert [r["statement_type"] for r in results] == ["execute", "execute", "execute", "execute", "fetch"]
+        assert results[2]["row_count"] == len(complex_test_data["users"])
+        assert results[3]["row_count"] == len(complex_test_data["orders"])
+        assert results[4]["row_count"] == len(complex_test_data["users"])
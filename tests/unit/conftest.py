@@ -0,0 +1,87 @@
+"""
+Pytest fixtures for splurge-sql-runner unit tests.
+
+Database client fixtures used only by the unit suite.
+"""
+
+import pytest
+
+
+def _drop_all_schema_objects(client) -> None:
+    """Drop every user trigger, view, and table so a shared SQLite client starts each test empty."""
+    from sqlalchemy import text
+
+    with client.connect() as conn:
+        objects = conn.execute(
+            text(
+                "SELECT type, name FROM sqlite_master "
+                "WHERE type IN ('trigger', 'view', 'table') AND name NOT LIKE 'sqlite_%' "
+                "ORDER BY CASE type WHEN 'trigger' THEN 0 WHEN 'view' THEN 1 ELSE 2 END"
+            )
+        ).all()
+        for object_type, name in objects:
+            conn.execute(text(f'DROP {object_type.upper()} IF EXISTS "{name}"'))
+        conn.commit()
+
+
+def _static_in_memory_client():
+    """Build an in-memory database client pinned to a single SQLite connection.
+
+    The engine uses ``StaticPool`` so every ``connect()`` reuses one underlying
+    SQLite connection, and therefore one in-memory database, regardless of thread.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    from splurge_sql_runner.database.database_client import DatabaseClient
+
+    client = DatabaseClient(database_url="sqlite:///:memory:")
+    client._engine = create_engine(
+        client.database_url,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    return client
+
+
+@pytest.fixture(scope="session")
+def _session_in_memory_db_client():
+    """In-memory database client whose engine is created once per session."""
+    client = _static_in_memory_client()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def seeded_db_client():
+    """Read-only in-memory client with a ``users`` table seeded once per session.
+
+    Tests using this fixture must not modify the schema or its rows.
+    """
+    client = _static_in_memory_client()
+    client.execute_sql(
+        [
+            "CREATE TABLE users (id INTEGER, name TEXT)",
+            "INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')",
+        ]
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def in_memory_db_client(_session_in_memory_db_client):
+    """Fast in-memory database client for unit tests, emptied after each test."""
+    yield _session_in_memory_db_client
+    _drop_all_schema_objects(_session_in_memory_db_client)
+
+
+@pytest.fixture
+def temp_db_client(tmp_path):
+    """Temporary file-based database client for tests needing persistence."""
+    from splurge_sql_runner.database.database_client import DatabaseClient
+
+    db_path = tmp_path / "test.db"
+    client = DatabaseClient(database_url=f"sqlite:///{db_path}")
+    yield client
+    client.close()
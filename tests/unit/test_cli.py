@@ -4,12 +4,10 @@ These tests mock out configuration loading and the SQL processing function
 so they run quickly and deterministically without touching a real database.
 """
 
-import os
-import tempfile
-
 import pytest
 
 import splurge_sql_runner.cli as cli_mod
+from splurge_sql_runner.exceptions import SplurgeSqlRunnerSecurityError
 
 
 def test_simple_table_format_empty():
@@ -24,7 +22,7 @@ def test_simple_table_format_basic():
 
 
 def test_pretty_print_results_empty(mocker):
-    mock_print = mocker.patch("builtins.print")
+    mock_print = mocker.patch("splurge_sql_runner.cli_output.print", create=True)
     cli_mod.pretty_print_results([])
     mock_print.assert_not_called()
 
@@ -38,7 +36,7 @@ def test_pretty_print_results_fetch(mocker):
             "result": [{"name": "Alice"}, {"name": "Bob"}],
         }
     ]
-    mock_print = mocker.patch("builtins.print")
+    mock_print = mocker.patch("splurge_sql_runner.cli_output.print", create=True)
     cli_mod.pretty_print_results(results)
     calls = [c[0][0] for c in mock_print.call_args_list]
     assert any("Rows returned" in str(c) for c in calls)
@@ -46,29 +44,14 @@ def test_pretty_print_results_fetch(mocker):
 
 class TestCliMain:
     @pytest.fixture
-    def temp_sql_file(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".sql", delete=False) as f:
-            f.write("SELECT 1;")
-            fname = f.name
-
-        yield fname
-
-        try:
-            os.unlink(fname)
-        except OSError:
-            pass
+    def temp_sql_file(self, tmp_path):
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1;")
+        return str(sql_file)
 
     @pytest.fixture
-    def sqlite_db_path(self):
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        yield db_path
-
-        try:
-            os.unlink(db_path)
-        except OSError:
-            pass
+    def sqlite_db_path(self, tmp_path):
+        return str(tmp_path / "test.db")
 
     def test_main_with_file_argument(self, temp_sql_file, sqlite_db_path, mocker):
         # Arrange: patch argv, load_config and process_sql_files to avoid DB work
@@ -88,8 +71,8 @@ class TestCliMain:
         # Act / Assert
         assert cli_mod.main() == cli_mod.EXIT_CODE_SUCCESS
 
-    def test_main_with_pattern_argument(self, temp_sql_file, sqlite_db_path, mocker):
-        pattern = os.path.join(os.path.dirname(temp_sql_file), "*.sql")
+    def test_main_with_pattern_argument(self, temp_sql_file, sqlite_db_path, tmp_path, mocker):
+        pattern = str(tmp_path / "*.sql")
         mocker.patch("sys.argv", new=["splurge_sql_runner", "-c", f"sqlite:///{sqlite_db_path}", "-p", pattern])
         mocker.patch.object(cli_mod, "load_config", return_value={})
         # Let process_sql_files report two files processed successfully
@@ -129,8 +112,6 @@ class TestCliMain:
     def test_main_security_validation_error_returns_failure(self, temp_sql_file, sqlite_db_path, mocker):
         mocker.patch("sys.argv", new=["splurge_sql_runner", "-c", f"sqlite:///{sqlite_db_path}", "-f", temp_sql_file])
         mocker.patch.object(cli_mod, "load_config", return_value={})
-        from splurge_sql_runner.exceptions import SplurgeSqlRunnerSecurityError
-
         mocker.patch.object(
             cli_mod, "process_sql_files", side_effect=SplurgeSqlRunnerSecurityError("Too many sql statements")
         )
@@ -1,6 +1,17 @@
+import sys
+from types import SimpleNamespace
+
 import splurge_sql_runner.cli as cli_mod
 
 
+def _noop(*args, **kwargs):
+    pass
+
+
+# Stand-in for the module logger returned by the patched configure_module_logging
+_NULL_LOGGER = SimpleNamespace(info=_noop, debug=_noop, error=_noop, warning=_noop)
+
+
 def test_missing_config_keys_use_defaults(monkeypatch, tmp_path):
     # Prepare SQL file
     sql_file = tmp_path / "one.sql"
@@ -12,22 +23,9 @@ def test_missing_config_keys_use_defaults(monkeypatch, tmp_path):
     # Capture configure_module_logging calls
     calls = []
 
-    class DummyLogger:
-        def info(self, *a, **kw):
-            pass
-
-        def debug(self, *a, **kw):
-            pass
-
-        def error(self, *a, **kw):
-            pass
-
-        def warning(self, *a, **kw):
-            pass
-
     def fake_configure(name, log_level="INFO"):
         calls.append((name, log_level))
-        return DummyLogger()
+        return _NULL_LOGGER
 
     monkeypatch.setattr(cli_mod, "configure_module_logging", fake_configure)
 
@@ -37,8 +35,6 @@ def test_missing_config_keys_use_defaults(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
 
-    import sys
-
     monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file)])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
@@ -56,22 +52,9 @@ def test_config_log_level_is_respected(monkeypatch, tmp_path):
 
     calls = []
 
-    class DummyLogger2:
-        def info(self, *a, **kw):
-            pass
-
-        def debug(self, *a, **kw):
-            pass
-
-        def error(self, *a, **kw):
-            pass
-
-        def warning(self, *a, **kw):
-            pass
-
     def fake_configure(name, log_level="INFO"):
         calls.append((name, log_level))
-        return DummyLogger2()
+        return _NULL_LOGGER
 
     monkeypatch.setattr(cli_mod, "configure_module_logging", fake_configure)
 
@@ -81,8 +64,6 @@ def test_config_log_level_is_respected(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
 
-    import sys
-
     monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file)])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
@@ -108,8 +89,6 @@ def test_config_max_statements_passed_to_process(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
 
-    import sys
-
     monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file)])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
@@ -138,8 +117,6 @@ def test_cli_explicit_max_statements_flag_overrides(monkeypatch, tmp_path):
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
 
     # Pass explicit --max-statements flag
-    import sys
-
     monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file), "--max-statements", "42"])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
@@ -4,6 +4,12 @@ import pytest
 
 import splurge_sql_runner.cli as cli_mod
 
+# Common argv prefix; each test derives its variant with [*_BASE_ARGV, ...]
+_BASE_ARGV = ("prog", "-c", "sqlite:///tmp.db")
+
+# Read-only per-file statement results shared by fake process_sql_files stubs
+_FETCH_ONE_RESULTS = [{"statement_type": "fetch", "statement": "SELECT 1;", "row_count": 1, "result": [{"col": 1}]}]
+
 
 def _make_summary_for_files(files):
     return {
@@ -26,7 +32,7 @@ def test_verbose_flag_prints_found(monkeypatch, tmp_path, capsys):
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
 
-    monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file), "-v"])
+    monkeypatch.setattr(sys, "argv", [*_BASE_ARGV, "-f", str(sql_file), "-v"])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
     captured = capsys.readouterr()
@@ -42,11 +48,7 @@ def test_json_flag_outputs_json(monkeypatch, tmp_path):
     def fake_process(files, **kwargs):
         # Return a fetch-style result to be serialized
         return {
-            "results": {
-                files[0]: [
-                    {"statement_type": "fetch", "statement": "SELECT 1;", "row_count": 1, "result": [{"col": 1}]}
-                ]
-            },
+            "results": {files[0]: _FETCH_ONE_RESULTS},
             "files_processed": 1,
             "files_passed": 1,
             "files_failed": 0,
@@ -54,7 +56,7 @@ def test_json_flag_outputs_json(monkeypatch, tmp_path):
         }
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
-    monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file), "--json"])
+    monkeypatch.setattr(sys, "argv", [*_BASE_ARGV, "-f", str(sql_file), "--json"])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
 
@@ -74,7 +76,7 @@ def test_max_statements_and_continue_on_error_passed(monkeypatch, tmp_path):
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
     monkeypatch.setattr(
         "sys.argv",
-        ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file), "--max-statements", "5", "--continue-on-error"],
+        [*_BASE_ARGV, "-f", str(sql_file), "--max-statements", "5", "--continue-on-error"],
     )
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
@@ -99,7 +101,7 @@ def test_security_level_passed_to_process(monkeypatch, tmp_path, level):
 
     monkeypatch.setattr(cli_mod, "load_config", fake_load)
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
-    monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-f", str(sql_file), "--security-level", level])
+    monkeypatch.setattr(sys, "argv", [*_BASE_ARGV, "-f", str(sql_file), "--security-level", level])
     ret = cli_mod.main()
     assert ret == cli_mod.EXIT_CODE_SUCCESS
     assert captured.get("security_level") == level
@@ -1,5 +1,11 @@
+import sys
+
 import splurge_sql_runner.cli as cli_mod
 
+# Read-only per-file statement results shared by the fake process_sql_files stub
+_EXECUTE_RESULTS = [{"statement": "SELECT 1;", "statement_type": "execute", "row_count": 1}]
+_ERROR_RESULTS = [{"statement": "SELECT 2;", "statement_type": "error", "error": "boom"}]
+
 
 def test_cli_partial_success_exit_code(monkeypatch, tmp_path, capsys):
     # Create two sql files
@@ -14,14 +20,12 @@ def test_cli_partial_success_exit_code(monkeypatch, tmp_path, capsys):
     # Fake process_sql_files returns mixed results (one error, one success)
     def fake_process(files, **kwargs):
         results = {
-            str(files[0]): [{"statement": "SELECT 1;", "statement_type": "execute", "row_count": 1}],
-            str(files[1]): [{"statement": "SELECT 2;", "statement_type": "error", "error": "boom"}],
+            str(files[0]): _EXECUTE_RESULTS,
+            str(files[1]): _ERROR_RESULTS,
         }
         return {"results": results, "files_processed": 2, "files_passed": 1, "files_failed": 0, "files_mixed": 1}
 
     monkeypatch.setattr(cli_mod, "process_sql_files", fake_process)
-    import sys
-
     monkeypatch.setattr(sys, "argv", ["prog", "-c", "sqlite:///tmp.db", "-p", str(tmp_path / "*.sql")])
 
     ret = cli_mod.main()
@@ -7,8 +7,6 @@ JSON file loading, environment variable overrides, and default values.
 
 import json
 import os
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -54,6 +52,14 @@ class TestGetDefaultConfig:
         assert config["enable_verbose"] is False
         assert config["enable_debug"] is False
 
+    def test_returns_independent_copies(self):
+        """Test that mutating a returned config does not leak into later calls."""
+        config = get_default_config()
+        config["database_url"] = "sqlite:///mutated.db"
+
+        assert get_default_config()["database_url"] == "sqlite:///:memory:"
+        assert get_default_config() is not get_default_config()
+
 
 class TestGetEnvConfig:
     """Test environment variable configuration loading."""
@@ -129,7 +135,7 @@ class TestGetEnvConfig:
 class TestLoadJsonConfig:
     """Test JSON configuration file loading."""
 
-    def test_loads_valid_json_file(self):
+    def test_loads_valid_json_file(self, tmp_path):
         """Test loading a valid JSON configuration file."""
         config_data = {
             "database": {"url": "sqlite:///test.db", "connection": {"timeout": 60}},
@@ -138,36 +144,28 @@ class TestLoadJsonConfig:
             "security_level": "strict",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_file = f.name
+        temp_file = tmp_path / "config.json"
+        temp_file.write_text(json.dumps(config_data))
 
-        try:
-            config = load_json_config(temp_file)
-            assert config["database_url"] == "sqlite:///test.db"
-            assert config["connection_timeout"] == 60
-            assert config["max_statements_per_file"] == 200
-            assert config["log_level"] == "DEBUG"
-            assert config["security_level"] == "strict"
-        finally:
-            Path(temp_file).unlink()
+        config = load_json_config(str(temp_file))
+        assert config["database_url"] == "sqlite:///test.db"
+        assert config["connection_timeout"] == 60
+        assert config["max_statements_per_file"] == 200
+        assert config["log_level"] == "DEBUG"
+        assert config["security_level"] == "strict"
 
     def test_nonexistent_file_raises_error(self):
         """Test that nonexistent file raises ConfigFileError."""
         with pytest.raises(SplurgeSqlRunnerFileError, match="Failed to read config file"):
             load_json_config("nonexistent.json")
 
-    def test_invalid_json_raises_error(self):
+    def test_invalid_json_raises_error(self, tmp_path):
         """Test that invalid JSON raises ConfigFileError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("invalid json content")
-            temp_file = f.name
+        temp_file = tmp_path / "config.json"
+        temp_file.write_text("invalid json content")
 
-        try:
-            with pytest.raises(SplurgeSqlRunnerFileError, match="Invalid JSON"):
-                load_json_config(temp_file)
-        finally:
-            Path(temp_file).unlink()
+        with pytest.raises(SplurgeSqlRunnerFileError, match="Invalid JSON"):
+            load_json_config(str(temp_file))
 
 
 class TestLoadConfig:
@@ -180,7 +178,7 @@ class TestLoadConfig:
             expected = get_default_config()
             assert config == expected
 
-    def test_loads_json_config_file(self):
+    def test_loads_json_config_file(self, tmp_path):
         """Test loading configuration from JSON file."""
         config_data = {
             "database": {"url": "sqlite:///test.db"},
@@ -188,57 +186,44 @@ class TestLoadConfig:
             "logging": {"level": "ERROR"},
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_file = f.name
+        temp_file = tmp_path / "config.json"
+        temp_file.write_text(json.dumps(config_data))
 
-        try:
-            config = load_config(temp_file)
-            assert config["database_url"] == "sqlite:///test.db"
-            assert config["max_statements_per_file"] == 50
-            assert config["log_level"] == "ERROR"
-        finally:
-            Path(temp_file).unlink()
+        config = load_config(str(temp_file))
+        assert config["database_url"] == "sqlite:///test.db"
+        assert config["max_statements_per_file"] == 50
+        assert config["log_level"] == "ERROR"
 
-    def test_env_vars_override_json(self):
+    def test_env_vars_override_json(self, tmp_path):
         """Test that environment variables override JSON config."""
         config_data = {"database": {"url": "sqlite:///json.db"}, "max_statements_per_file": 50}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_file = f.name
+        temp_file = tmp_path / "config.json"
+        temp_file.write_text(json.dumps(config_data))
 
         env_vars = {"SPLURGE_SQL_RUNNER_DB_URL": "sqlite:///env.db", "SPLURGE_SQL_RUNNER_MAX_STATEMENTS_PER_FILE": "75"}
 
-        try:
-            with patch.dict(os.environ, env_vars):
-                config = load_config(temp_file)
-                assert config["database_url"] == "sqlite:///env.db"  # Env overrides JSON
-                assert config["max_statements_per_file"] == 75  # Env overrides JSON
-        finally:
-            Path(temp_file).unlink()
+        with patch.dict(os.environ, env_vars):
+            config = load_config(str(temp_file))
+            assert config["database_url"] == "sqlite:///env.db"  # Env overrides JSON
+            assert config["max_statements_per_file"] == 75  # Env overrides JSON
 
 
 class TestSaveConfig:
     """Test configuration saving functionality."""
 
-    def test_saves_config_to_file(self):
+    def test_saves_config_to_file(self, tmp_path):
         """Test saving configuration to JSON file."""
         config = {"database_url": "sqlite:///test.db", "max_statements_per_file": 50, "log_level": "DEBUG"}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_file = f.name
+        temp_file = tmp_path / "config.json"
 
-        try:
-            save_config(config, temp_file)
+        save_config(config, str(temp_file))
 
-            # Verify file was written correctly
-            with open(temp_file) as f:
-                saved_data = json.load(f)
+        # Verify file was written correctly
+        saved_data = json.loads(temp_file.read_text())
 
-            assert saved_data == config
-        finally:
-            Path(temp_file).unlink()
+        assert saved_data == config
 
     def test_save_config_error_handling(self):
         """Test error handling when saving config fails."""
@@ -63,50 +63,35 @@ class TestConnectionConstants:
         assert 5 <= DEFAULT_CONNECTION_TIMEOUT <= 300
 
 
-class TestDangerousPatterns:
-    """Test dangerous pattern constants."""
+# (patterns, entries each list must contain) for every dangerous-pattern constant
+_DANGEROUS_PATTERN_CASES = pytest.mark.parametrize(
+    ("patterns", "expected_patterns"),
+    [
+        (DANGEROUS_PATH_PATTERNS, ("..", "~", "/etc", "/var", "/usr")),
+        (DANGEROUS_SQL_PATTERNS, ("DROP DATABASE", "TRUNCATE DATABASE", "EXEC ", "XP_")),
+        (DANGEROUS_URL_PATTERNS, ("--", "/*", "*/", "javascript:", "data:")),
+    ],
+    ids=["path", "sql", "url"],
+)
 
-    @pytest.mark.unit
-    def test_dangerous_path_patterns_are_strings(self) -> None:
-        """Test that all dangerous path patterns are strings."""
-        for pattern in DANGEROUS_PATH_PATTERNS:
-            assert isinstance(pattern, str)
-            assert len(pattern) > 0
 
-    @pytest.mark.unit
-    def test_dangerous_sql_patterns_are_strings(self) -> None:
-        """Test that all dangerous SQL patterns are strings."""
-        for pattern in DANGEROUS_SQL_PATTERNS:
-            assert isinstance(pattern, str)
-            assert len(pattern) > 0
+class TestDangerousPatterns:
+    """Test dangerous pattern constants."""
 
     @pytest.mark.unit
-    def test_dangerous_url_patterns_are_strings(self) -> None:
-        """Test that all dangerous URL patterns are strings."""
-        for pattern in DANGEROUS_URL_PATTERNS:
+    @_DANGEROUS_PATTERN_CASES
+    def test_dangerous_patterns_are_strings(self, patterns, expected_patterns) -> None:
+        """Test that all dangerous patterns are non-empty strings."""
+        for pattern in patterns:
             assert isinstance(pattern, str)
             assert len(pattern) > 0
 
     @pytest.mark.unit
-    def test_dangerous_path_patterns_contain_expected_patterns(self) -> None:
-        """Test that dangerous path patterns contain expected system paths."""
-        expected_patterns = ["..", "~", "/etc", "/var", "/usr"]
-        for pattern in expected_patterns:
-            assert pattern in DANGEROUS_PATH_PATTERNS
-
-    @pytest.mark.unit
-    def test_dangerous_sql_patterns_contain_expected_patterns(self) -> None:
-        """Test that dangerous SQL patterns contain expected dangerous commands."""
-        expected_patterns = ["DROP DATABASE", "TRUNCATE DATABASE", "EXEC ", "XP_"]
-        for pattern in expected_patterns:
-            assert pattern in DANGEROUS_SQL_PATTERNS
-
-    @pytest.mark.unit
-    def test_dangerous_url_patterns_contain_expected_patterns(self) -> None:
-        """Test that dangerous URL patterns contain expected dangerous patterns."""
-        expected_patterns = ["--", "/*", "*/", "javascript:", "data:"]
+    @_DANGEROUS_PATTERN_CASES
+    def test_dangerous_patterns_contain_expected_patterns(self, patterns, expected_patterns) -> None:
+        """Test that each dangerous pattern list contains its expected entries."""
         for pattern in expected_patterns:
-            assert pattern in DANGEROUS_URL_PATTERNS
+            assert pattern in patterns
 
 
 class TestFileExtensionConstants:
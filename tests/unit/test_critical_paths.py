@@ -7,6 +7,7 @@ Run these tests first to ensure core functionality is intact.
 
 import pytest
 
+from splurge_sql_runner.database.database_client import DatabaseClient
 from splurge_sql_runner.exceptions import SplurgeSqlRunnerSecurityError
 from splurge_sql_runner.security import SecurityValidator
 
@@ -16,11 +17,14 @@ from splurge_sql_runner.security import SecurityValidator
 class TestCriticalDatabaseOperations:
     """Critical database operations that must always work."""
 
-    def test_in_memory_database_connection(self, in_memory_db_client):
+    def test_in_memory_database_connection(self):
         """Test that we can connect to an in-memory database."""
+        client = DatabaseClient(database_url="sqlite:///:memory:")
+
         # This should not raise any exceptions
-        conn = in_memory_db_client.connect()
+        conn = client.connect()
         conn.close()
+        client.close()
 
     def test_basic_sql_execution(self, in_memory_db_client):
         """Test basic SQL execution."""
@@ -28,15 +32,9 @@ class TestCriticalDatabaseOperations:
         results = in_memory_db_client.execute_sql(statements)
         assert len(results) == 2
 
-    def test_select_execution(self, in_memory_db_client):
+    def test_select_execution(self, seeded_db_client):
         """Test SELECT statement execution."""
-        # Setup
-        in_memory_db_client.execute_sql(
-            ["CREATE TABLE users (id INTEGER, name TEXT)", "INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"]
-        )
-
-        # Test SELECT
-        results = in_memory_db_client.execute_sql(["SELECT * FROM users ORDER BY id"])
+        results = seeded_db_client.execute_sql(["SELECT * FROM users ORDER BY id"])
         assert len(results) == 1  # One result set
         assert results[0]["row_count"] == 2  # Two rows
 
@@ -21,6 +21,7 @@ from splurge_sql_runner.logging.context import (
     log_context,
     set_correlation_id,
 )
+from splurge_sql_runner.logging.core import get_logger
 
 
 class TestCorrelationIdManagement:
@@ -219,6 +220,25 @@ class TestContextualLogger:
         formatted = self.contextual_logger._format_message_with_context("Test message")
         assert "Test message | user_id=123 | operation=test" in formatted
 
+    def test_format_message_reflects_rebound_context(self) -> None:
+        """Test re-binding a key replaces its value in formatted messages."""
+        self.contextual_logger.bind(user_id="123")
+        assert self.contextual_logger._format_message_with_context("First") == "First | user_id=123"
+
+        self.contextual_logger.bind(user_id="456", operation="test")
+        formatted = self.contextual_logger._format_message_with_context("Second")
+        assert formatted == "Second | user_id=456 | operation=test"
+
+    def test_format_message_renders_current_bound_values(self) -> None:
+        """Test in-place changes to a bound value show up on the next log call."""
+        tables = ["users"]
+        self.contextual_logger.bind(tables=tables)
+        assert self.contextual_logger._format_message_with_context("First") == "First | tables=['users']"
+
+        tables.append("orders")
+        formatted = self.contextual_logger._format_message_with_context("Second")
+        assert formatted == "Second | tables=['users', 'orders']"
+
     def test_format_message_without_context(self) -> None:
         """Test message formatting without context."""
         formatted = self.contextual_logger._format_message_with_context("Test message")
@@ -233,13 +253,20 @@ class TestContextualLogger:
         self.contextual_logger.warning("Test warning message")
         self.contextual_logger.error("Test error message")
 
-        log_content = self.log_output.getvalue()
+        # Verify context is included in all messages, in order
+        assert tuple(self.log_output.getvalue().splitlines()) == (
+            "Test info message | user_id=123",
+            "Test warning message | user_id=123",
+            "Test error message | user_id=123",
+        )
+
+    def test_logging_methods_without_context(self) -> None:
+        """Test logging methods pass messages through unchanged when no context is bound."""
+        self.contextual_logger.debug("Plain debug message")
+        self.contextual_logger.critical("Plain critical message")
 
-        # Verify context is included in all messages
-        assert "user_id=123" in log_content
-        assert "Test info message | user_id=123" in log_content
-        assert "Test warning message | user_id=123" in log_content
-        assert "Test error message | user_id=123" in log_content
+        log_lines = self.log_output.getvalue().splitlines()
+        assert log_lines == ["Plain debug message", "Plain critical message"]
 
     def test_logging_methods_with_args(self) -> None:
         """Test logging methods with format args."""
@@ -281,8 +308,6 @@ class TestLogContext:
         self.handler = logging.StreamHandler(self.log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         self.logger = get_logger()
         self.logger.addHandler(self.handler)
         self.logger.setLevel(logging.DEBUG)
@@ -363,8 +388,6 @@ class TestLogContextFunction:
         self.handler = logging.StreamHandler(self.log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         self.logger = get_logger()
         self.logger.addHandler(self.handler)
         self.logger.setLevel(logging.DEBUG)
@@ -454,10 +477,8 @@ class TestGetContextualLogger:
         """Test get_contextual_logger uses main logger configuration."""
         logger = get_contextual_logger("test_main_logger")
 
-        # Verify it has the proper logger structure
-        assert hasattr(logger, "_logger")
-        assert hasattr(logger, "_context")
-        assert hasattr(logger, "bind")
+        assert isinstance(logger, ContextualLogger)
+        assert logger._logger is get_logger("splurge_sql_runner")
 
 
 class TestIntegrationScenarios:
@@ -498,8 +519,6 @@ class TestIntegrationScenarios:
         handler = logging.StreamHandler(log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         logger = get_logger()
         logger.addHandler(handler)
         logger.setLevel(logging.DEBUG)
@@ -9,6 +9,7 @@ import threading
 import time
 from io import StringIO
 
+from splurge_sql_runner.logging.core import get_logger
 from splurge_sql_runner.logging.performance import (
     PerformanceLogger,
     log_performance,
@@ -161,8 +162,6 @@ class TestLogPerformanceDecorator:
         self.handler = logging.StreamHandler(self.log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         self.logger = get_logger()
         self.logger.addHandler(self.handler)
         self.logger.setLevel(logging.DEBUG)
@@ -264,8 +263,6 @@ class TestPerformanceContext:
         self.handler = logging.StreamHandler(self.log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         self.logger = get_logger()
         self.logger.addHandler(self.handler)
         self.logger.setLevel(logging.DEBUG)
@@ -349,8 +346,6 @@ class TestPerformanceIntegration:
         self.handler = logging.StreamHandler(self.log_output)
 
         # Get the main logger and add our handler
-        from splurge_sql_runner.logging.core import get_logger
-
         self.logger = get_logger()
         self.logger.addHandler(self.handler)
         self.logger.setLevel(logging.DEBUG)
@@ -4,6 +4,10 @@ Unit tests for result_models.py module.
 Tests the typed result models and conversion utilities.
 """
 
+import dataclasses
+
+import pytest
+
 from splurge_sql_runner.result_models import (
     StatementResult,
     StatementType,
@@ -12,6 +16,36 @@ from splurge_sql_runner.result_models import (
 )
 
 
+@pytest.fixture(scope="module")
+def fetch_result() -> StatementResult:
+    """Shared FETCH result for read-only conversion tests (StatementResult is frozen)."""
+    return StatementResult(
+        statement="SELECT * FROM users",
+        statement_type=StatementType.FETCH,
+        result=[{"id": 1, "name": "Alice"}],
+        row_count=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def execute_result() -> StatementResult:
+    """Shared EXECUTE result for read-only conversion tests."""
+    return StatementResult(
+        statement="INSERT INTO users VALUES (1, 'Bob')",
+        statement_type=StatementType.EXECUTE,
+        result=True,
+        row_count=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def error_result() -> StatementResult:
+    """Shared ERROR result for read-only conversion tests."""
+    return StatementResult(
+        statement="INVALID SQL", statement_type=StatementType.ERROR, result=None, error="Syntax error near INVALID"
+    )
+
+
 class TestStatementType:
     """Test StatementType enum."""
 
@@ -68,20 +102,23 @@ class TestStatementResult:
         assert result.row_count is None
         assert "Syntax error" in result.error
 
+    def test_statement_result_is_immutable(self):
+        """Test StatementResult is frozen and derived via dataclasses.replace."""
+        fetch_result = StatementResult(statement="SELECT 1", statement_type=StatementType.FETCH, result=[{"1": 1}])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            fetch_result.row_count = 1  # type: ignore[misc]
+
+        counted_result = dataclasses.replace(fetch_result, row_count=1)
+        assert counted_result.row_count == 1
+        assert fetch_result.row_count is None
+
 
 class TestStatementResultToDict:
     """Test statement_result_to_dict conversion function."""
 
-    def test_fetch_result_conversion(self):
+    def test_fetch_result_conversion(self, fetch_result):
         """Test converting FETCH result to dict."""
-        result = StatementResult(
-            statement="SELECT * FROM users",
-            statement_type=StatementType.FETCH,
-            result=[{"id": 1, "name": "Alice"}],
-            row_count=1,
-        )
-
-        dict_result = statement_result_to_dict(result)
+        dict_result = statement_result_to_dict(fetch_result)
 
         expected = {
             "statement": "SELECT * FROM users",
@@ -91,16 +128,20 @@ class TestStatementResultToDict:
         }
         assert dict_result == expected
 
-    def test_execute_result_conversion(self):
-        """Test converting EXECUTE result to dict."""
-        result = StatementResult(
-            statement="INSERT INTO users VALUES (1, 'Bob')",
-            statement_type=StatementType.EXECUTE,
-            result=True,
-            row_count=1,
-        )
+    def test_fetch_result_rows_are_copied(self):
+        """Test editing converted rows does not change the frozen StatementResult."""
+        rows = [{"id": 1, "name": "Alice"}]
+        result = StatementResult(statement="SELECT 1", statement_type=StatementType.FETCH, result=rows, row_count=1)
 
         dict_result = statement_result_to_dict(result)
+        dict_result["result"].append({"id": 2, "name": "Bob"})
+        dict_result["result"][0]["name"] = "Mallory"
+
+        assert result.result == [{"id": 1, "name": "Alice"}]
+
+    def test_execute_result_conversion(self, execute_result):
+        """Test converting EXECUTE result to dict."""
+        dict_result = statement_result_to_dict(execute_result)
 
         expected = {
             "statement": "INSERT INTO users VALUES (1, 'Bob')",
@@ -110,13 +151,9 @@ class TestStatementResultToDict:
         }
         assert dict_result == expected
 
-    def test_error_result_conversion(self):
+    def test_error_result_conversion(self, error_result):
         """Test converting ERROR result to dict."""
-        result = StatementResult(
-            statement="INVALID SQL", statement_type=StatementType.ERROR, result=None, error="Syntax error near INVALID"
-        )
-
-        dict_result = statement_result_to_dict(result)
+        dict_result = statement_result_to_dict(error_result)
 
         expected = {"statement": "INVALID SQL", "statement_type": "error", "error": "Syntax error near INVALID"}
         assert dict_result == expected
@@ -159,21 +196,9 @@ class TestResultsToDicts:
         assert results[1]["statement"] == "INSERT INTO test VALUES (1)"
         assert results[1]["statement_type"] == "execute"
 
-    def test_converts_all_typed_results(self):
+    def test_converts_all_typed_results(self, fetch_result, execute_result):
         """Test converting list of all StatementResult objects."""
-        results = [
-            StatementResult(
-                statement="SELECT * FROM users", statement_type=StatementType.FETCH, result=[{"id": 1}], row_count=1
-            ),
-            StatementResult(
-                statement="INSERT INTO users VALUES (2, 'Bob')",
-                statement_type=StatementType.EXECUTE,
-                result=True,
-                row_count=1,
-            ),
-        ]
-
-        dict_results = results_to_dicts(results)
+        dict_results = results_to_dicts([fetch_result, execute_result])
 
         assert len(dict_results) == 2
         assert dict_results[0]["statement_type"] == "fetch"
@@ -4,9 +4,6 @@ Unit tests for Security module.
 Tests risk-based security validation with strict, normal, and permissive levels.
 """
 
-import os
-import tempfile
-
 import pytest
 
 from splurge_sql_runner.exceptions import (
@@ -15,26 +12,21 @@ from splurge_sql_runner.exceptions import (
 )
 from splurge_sql_runner.security import SecurityValidator
 
+# Script over the 100-statement limit, built once for the statement-count tests
+_TWO_HUNDRED_SELECTS = "; ".join(f"SELECT {i} FROM users" for i in range(200))
+
 
 @pytest.mark.critical
 @pytest.mark.security
 class TestSecurityValidator:
     """Test the SecurityValidator class."""
 
-    @pytest.fixture
-    def temp_sql_file(self):
-        """Create a temporary SQL file for testing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".sql", delete=False) as f:
-            f.write("SELECT * FROM users;")
-            temp_file = f.name
-
-        yield temp_file
-
-        # Cleanup
-        try:
-            os.unlink(temp_file)
-        except OSError:
-            pass
+    @pytest.fixture(scope="module")
+    def temp_sql_file(self, tmp_path_factory):
+        """Create a read-only temporary SQL file shared by this module's tests."""
+        temp_file = tmp_path_factory.mktemp("security") / "test.sql"
+        temp_file.write_text("SELECT * FROM users;")
+        return str(temp_file)
 
 
 class TestValidateDatabaseUrl(TestSecurityValidator):
@@ -110,15 +102,20 @@ class TestValidateDatabaseUrl(TestSecurityValidator):
 
     def test_too_many_statements_normal(self):
         """Test validation of SQL with too many statements (normal)."""
-        many_statements = "; ".join([f"SELECT {i} FROM users" for i in range(200)])
         with pytest.raises(SplurgeSqlRunnerSecurityError, match="Too many SQL statements"):
-            SecurityValidator.validate_sql_content(many_statements, "normal", 100)
+            SecurityValidator.validate_sql_content(_TWO_HUNDRED_SELECTS, "normal", 100)
 
     def test_too_many_statements_strict(self):
         """Test validation of SQL with too many statements (strict)."""
-        many_statements = "; ".join([f"SELECT {i} FROM users" for i in range(200)])
         with pytest.raises(SplurgeSqlRunnerSecurityError, match="Too many SQL statements"):
-            SecurityValidator.validate_sql_content(many_statements, "strict", 100)
+            SecurityValidator.validate_sql_content(_TWO_HUNDRED_SELECTS, "strict", 100)
+
+    def test_precomputed_statement_count_is_used(self):
+        """Test a caller-supplied statement count is checked instead of re-parsing."""
+        with pytest.raises(SplurgeSqlRunnerSecurityError, match="Too many SQL statements"):
+            SecurityValidator.validate_sql_content("SELECT 1;", "normal", 100, statement_count=101)
+
+        SecurityValidator.validate_sql_content("SELECT 1;", "normal", 100, statement_count=100)
 
     def test_normal_allows_reasonable_statements(self):
         """Test that normal mode allows reasonable number of statements."""
@@ -122,6 +122,36 @@ class TestSecurityLevels:
         # Permissive mode has fewer restrictions
         assert len(patterns.get("dangerous_sql", [])) == 0
 
+    def test_public_pattern_collections_are_immutable(self) -> None:
+        """Test each level's public pattern collections are tuples."""
+        for patterns in (
+            SecurityValidator.STRICT_PATTERNS,
+            SecurityValidator.NORMAL_PATTERNS,
+            SecurityValidator.PERMISSIVE_PATTERNS,
+        ):
+            assert all(isinstance(value, tuple) for value in patterns.values())
+
+    def test_replaced_pattern_attribute_is_enforced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test replacing a level's whole pattern attribute takes effect on the next validation."""
+        monkeypatch.setattr(
+            SecurityValidator,
+            "NORMAL_PATTERNS",
+            {"dangerous_paths": (), "dangerous_sql": ("GRANT ",), "dangerous_urls": ()},
+        )
+        with pytest.raises(SplurgeSqlRunnerSecurityError):
+            SecurityValidator.validate_sql_content("GRANT ALL ON users TO bob;", "normal")
+
+    def test_reassigned_public_patterns_are_enforced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a newly assigned pattern collection is enforced and the old one is dropped."""
+        monkeypatch.setattr(
+            SecurityValidator,
+            "NORMAL_PATTERNS",
+            {"dangerous_paths": [], "dangerous_sql": [], "dangerous_urls": ["Internal-Host"]},
+        )
+        with pytest.raises(SplurgeSqlRunnerSecurityError):
+            SecurityValidator.validate_database_url("postgresql://user@internal-host/db", "normal")
+        SecurityValidator.validate_database_url("sqlite:///javascript:.db", "normal")
+
     def test_invalid_security_level_raises_error(self) -> None:
         """Test invalid security level raises error."""
         with pytest.raises(SplurgeSqlRunnerValueError):
@@ -7,6 +7,14 @@ import pytest
 from splurge_sql_runner.sql_helper import detect_statement_type
 
 
+@pytest.fixture(autouse=True)
+def _clear_statement_type_cache():
+    """Clear detect_statement_type's LRU cache so each test exercises the parser branch it targets."""
+    detect_statement_type.cache_clear()
+    yield
+    detect_statement_type.cache_clear()
+
+
 @pytest.mark.unit
 def test_values_returns_fetch():
     assert detect_statement_type("VALUES (1, 'A'), (2, 'B')") == "fetch"
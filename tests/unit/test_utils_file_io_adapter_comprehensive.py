@@ -10,311 +10,259 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from splurge_sql_runner._vendor.splurge_safe_io.exceptions import (
+    SplurgeSafeIoLookupError,
+    SplurgeSafeIoOSError,
+    SplurgeSafeIoPermissionError,
+    SplurgeSafeIoRuntimeError,
+    SplurgeSafeIoUnicodeError,
+)
 from splurge_sql_runner.exceptions import SplurgeSqlRunnerFileError
 from splurge_sql_runner.utils.file_io_adapter import FileIoAdapter
 
 
+@pytest.fixture
+def mock_reader(mocker) -> MagicMock:
+    """Patch SafeTextFileReader and return the reader instance FileIoAdapter will use."""
+    return mocker.patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader").return_value
+
+
 class TestFileIoAdapterReadFileErrorHandling:
     """Test FileIoAdapter.read_file() exception handling paths."""
 
-    def test_read_file_permission_error_with_config_context(self, tmp_path: Path) -> None:
+    def test_read_file_permission_error_with_config_context(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test PermissionError handling with config context type."""
         test_file = tmp_path / "config.json"
         test_file.write_text('{"key": "value"}', encoding="utf-8")
 
         # Mock SafeTextFileReader to raise PermissionError
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
-
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={"file_path": str(test_file)},
-            )
+        mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={"file_path": str(test_file)},
+        )
 
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), context_type="config")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), context_type="config")
 
-            error = exc_info.value
-            assert "Permission denied" in str(error)
-            assert "configuration file" in str(error)
-            assert error.details is not None
-            assert error.details["context_type"] == "config"
-            assert error.details["file_path"] == str(test_file)
+        error = exc_info.value
+        assert "Permission denied" in str(error)
+        assert "configuration file" in str(error)
+        assert error.details is not None
+        assert error.details["context_type"] == "config"
+        assert error.details["file_path"] == str(test_file)
 
-    def test_read_file_permission_error_with_sql_context(self, tmp_path: Path) -> None:
+    def test_read_file_permission_error_with_sql_context(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test PermissionError handling with sql context type."""
         test_file = tmp_path / "query.sql"
         test_file.write_text("SELECT 1;", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
-
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={"file_path": str(test_file)},
-            )
+        mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={"file_path": str(test_file)},
+        )
 
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), context_type="sql")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), context_type="sql")
 
-            error = exc_info.value
-            assert "Permission denied" in str(error)
-            assert "SQL file" in str(error)
-            assert error.details["context_type"] == "sql"
+        error = exc_info.value
+        assert "Permission denied" in str(error)
+        assert "SQL file" in str(error)
+        assert error.details["context_type"] == "sql"
 
-    def test_read_file_permission_error_with_generic_context(self, tmp_path: Path) -> None:
+    def test_read_file_permission_error_with_generic_context(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test PermissionError handling with generic context type."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
-
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={"file_path": str(test_file)},
-            )
+        mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={"file_path": str(test_file)},
+        )
 
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), context_type="generic")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), context_type="generic")
 
-            error = exc_info.value
-            assert "Permission denied" in str(error)
-            assert "file" in str(error)
-            assert error.details["context_type"] == "generic"
+        error = exc_info.value
+        assert "Permission denied" in str(error)
+        assert "file" in str(error)
+        assert error.details["context_type"] == "generic"
 
-    def test_read_file_permission_error_with_custom_context(self, tmp_path: Path) -> None:
+    def test_read_file_permission_error_with_custom_context(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test PermissionError handling with custom/unknown context type."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
-
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={"file_path": str(test_file)},
-            )
+        mock_reader.read.side_effect = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={"file_path": str(test_file)},
+        )
 
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), context_type="custom_type")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), context_type="custom_type")
 
-            error = exc_info.value
-            assert "Permission denied" in str(error)
-            assert error.details["context_type"] == "custom_type"
-            # Custom context type should be used as-is in message
-            assert "custom_type" in str(error)
+        error = exc_info.value
+        assert "Permission denied" in str(error)
+        assert error.details["context_type"] == "custom_type"
+        # Custom context type should be used as-is in message
+        assert "custom_type" in str(error)
 
-    def test_read_file_lookup_error_encoding_issue(self, tmp_path: Path) -> None:
+    def test_read_file_lookup_error_encoding_issue(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test LookupError handling for encoding/codec issues."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoLookupError
-
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoLookupError(
-                message="Codecs not found",
-                details={"encoding": "invalid-encoding"},
-            )
+        mock_reader.read.side_effect = SplurgeSafeIoLookupError(
+            message="Codecs not found",
+            details={"encoding": "invalid-encoding"},
+        )
 
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), encoding="invalid-encoding")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), encoding="invalid-encoding")
 
-            error = exc_info.value
-            assert "Codecs" in str(error) or "codecs" in str(error)
-            assert error.details is not None
-            assert error.details["encoding"] == "invalid-encoding"
-            assert error.details["context_type"] == "generic"
+        error = exc_info.value
+        assert "Codecs" in str(error) or "codecs" in str(error)
+        assert error.details is not None
+        assert error.details["encoding"] == "invalid-encoding"
+        assert error.details["context_type"] == "generic"
 
-    def test_read_file_unicode_error_invalid_encoding(self, tmp_path: Path) -> None:
+    def test_read_file_unicode_error_invalid_encoding(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test UnicodeError handling for invalid encoding in file."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoUnicodeError
+        mock_reader.read.side_effect = SplurgeSafeIoUnicodeError(
+            message="Invalid encoding",
+            details={"encoding": "utf-8"},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoUnicodeError(
-                message="Invalid encoding",
-                details={"encoding": "utf-8"},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), encoding="utf-8", context_type="sql")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), encoding="utf-8", context_type="sql")
 
-            error = exc_info.value
-            assert "Invalid encoding" in str(error)
-            assert error.details["context_type"] == "sql"
+        error = exc_info.value
+        assert "Invalid encoding" in str(error)
+        assert error.details["context_type"] == "sql"
 
-    def test_read_file_os_error(self, tmp_path: Path) -> None:
+    def test_read_file_os_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test OSError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoOSError
+        mock_reader.read.side_effect = SplurgeSafeIoOSError(
+            message="OS error",
+            details={"errno": 13},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoOSError(
-                message="OS error",
-                details={"errno": 13},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file), context_type="config")
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file), context_type="config")
 
-            error = exc_info.value
-            assert "OS error" in str(error)
-            assert error.details["context_type"] == "config"
+        error = exc_info.value
+        assert "OS error" in str(error)
+        assert error.details["context_type"] == "config"
 
-    def test_read_file_runtime_error(self, tmp_path: Path) -> None:
+    def test_read_file_runtime_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test RuntimeError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoRuntimeError
+        mock_reader.read.side_effect = SplurgeSafeIoRuntimeError(
+            message="Runtime error",
+            details={"reason": "unknown"},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = SplurgeSafeIoRuntimeError(
-                message="Runtime error",
-                details={"reason": "unknown"},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file))
 
-            error = exc_info.value
-            assert "Runtime error" in str(error)
-            assert error.details["context_type"] == "generic"
+        error = exc_info.value
+        assert "Runtime error" in str(error)
+        assert error.details["context_type"] == "generic"
 
 
 class TestFileIoAdapterReadFileChunkedErrorHandling:
     """Test FileIoAdapter.read_file_chunked() exception handling paths."""
 
-    def test_read_file_chunked_permission_error(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_permission_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test read_file_chunked PermissionError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("line1\nline2\n", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
+        mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={"file_path": str(test_file)},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={"file_path": str(test_file)},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file), context_type="sql"))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file), context_type="sql"))
 
-            error = exc_info.value
-            assert "Permission denied" in str(error)
-            assert "SQL file" in str(error)
-            assert error.details["context_type"] == "sql"
+        error = exc_info.value
+        assert "Permission denied" in str(error)
+        assert "SQL file" in str(error)
+        assert error.details["context_type"] == "sql"
 
-    def test_read_file_chunked_lookup_error(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_lookup_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test read_file_chunked LookupError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoLookupError
+        mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoLookupError(
+            message="Codecs not found",
+            details={"encoding": "invalid"},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoLookupError(
-                message="Codecs not found",
-                details={"encoding": "invalid"},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file), encoding="invalid"))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file), encoding="invalid"))
 
-            error = exc_info.value
-            assert "Codecs" in str(error) or "codecs" in str(error)
-            assert error.details["encoding"] == "invalid"
+        error = exc_info.value
+        assert "Codecs" in str(error) or "codecs" in str(error)
+        assert error.details["encoding"] == "invalid"
 
-    def test_read_file_chunked_unicode_error(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_unicode_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test read_file_chunked UnicodeError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoUnicodeError
+        mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoUnicodeError(
+            message="Invalid encoding",
+            details={},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoUnicodeError(
-                message="Invalid encoding",
-                details={},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file), context_type="config"))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file), context_type="config"))
 
-            error = exc_info.value
-            assert "Invalid encoding" in str(error)
-            assert error.details["context_type"] == "config"
+        error = exc_info.value
+        assert "Invalid encoding" in str(error)
+        assert error.details["context_type"] == "config"
 
-    def test_read_file_chunked_os_error(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_os_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test read_file_chunked OSError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoOSError
+        mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoOSError(
+            message="OS error",
+            details={},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoOSError(
-                message="OS error",
-                details={},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file)))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file)))
 
-            error = exc_info.value
-            assert "OS error" in str(error)
+        error = exc_info.value
+        assert "OS error" in str(error)
 
-    def test_read_file_chunked_runtime_error(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_runtime_error(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test read_file_chunked RuntimeError handling."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoRuntimeError
+        mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoRuntimeError(
+            message="Runtime error",
+            details={},
+        )
 
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = SplurgeSafeIoRuntimeError(
-                message="Runtime error",
-                details={},
-            )
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file)))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file)))
 
-            error = exc_info.value
-            assert "Runtime error" in str(error)
+        error = exc_info.value
+        assert "Runtime error" in str(error)
 
     def test_read_file_chunked_file_not_found_error(self) -> None:
         """Test read_file_chunked FileNotFoundError handling."""
@@ -386,9 +334,9 @@ class TestFileIoAdapterValidateFileSize:
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        # Mock Path.stat() to raise a generic exception
-        with patch("pathlib.Path.stat") as mock_stat:
-            mock_stat.side_effect = OSError("Access denied")
+        # Make stat() raise a generic exception; patch only the adapter's Path, not pathlib globally
+        with patch("splurge_sql_runner.utils.file_io_adapter.Path") as mock_path:
+            mock_path.return_value.stat.side_effect = OSError("Access denied")
 
             with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
                 FileIoAdapter.validate_file_size(str(test_file))
@@ -459,49 +407,39 @@ class TestFileIoAdapterEdgeCases:
         # Should return at least one empty chunk
         assert len(chunks) >= 0
 
-    def test_read_file_preserves_original_exception(self, tmp_path: Path) -> None:
+    def test_read_file_preserves_original_exception(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test that original exception is preserved in exception chain."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoPermissionError
+        original_error = SplurgeSafeIoPermissionError(
+            message="Permission denied",
+            details={},
+        )
+        mock_reader.read.side_effect = original_error
 
-            original_error = SplurgeSafeIoPermissionError(
-                message="Permission denied",
-                details={},
-            )
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.read.side_effect = original_error
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                FileIoAdapter.read_file(str(test_file))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            FileIoAdapter.read_file(str(test_file))
 
-            # Verify exception chaining
-            assert exc_info.value.__cause__ is original_error
+        # Verify exception chaining
+        assert exc_info.value.__cause__ is original_error
 
-    def test_read_file_chunked_preserves_original_exception(self, tmp_path: Path) -> None:
+    def test_read_file_chunked_preserves_original_exception(self, tmp_path: Path, mock_reader: MagicMock) -> None:
         """Test that original exception is preserved in read_file_chunked."""
         test_file = tmp_path / "file.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch("splurge_sql_runner.utils.file_io_adapter.SafeTextFileReader") as mock_reader_class:
-            from splurge_sql_runner._vendor.splurge_safe_io.exceptions import SplurgeSafeIoUnicodeError
+        original_error = SplurgeSafeIoUnicodeError(
+            message="Invalid encoding",
+            details={},
+        )
+        mock_reader.readlines_as_stream.side_effect = original_error
 
-            original_error = SplurgeSafeIoUnicodeError(
-                message="Invalid encoding",
-                details={},
-            )
-            mock_reader = MagicMock()
-            mock_reader_class.return_value = mock_reader
-            mock_reader.readlines_as_stream.side_effect = original_error
-
-            with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
-                list(FileIoAdapter.read_file_chunked(str(test_file)))
+        with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
+            list(FileIoAdapter.read_file_chunked(str(test_file)))
 
-            # Verify exception chaining
-            assert exc_info.value.__cause__ is original_error
+        # Verify exception chaining
+        assert exc_info.value.__cause__ is original_error
 
     def test_validate_file_size_preserves_original_exception(self, tmp_path: Path) -> None:
         """Test that original exception is preserved in validate_file_size."""
@@ -510,8 +448,8 @@ class TestFileIoAdapterEdgeCases:
 
         original_error = FileNotFoundError("File not found")
 
-        with patch("pathlib.Path.stat") as mock_stat:
-            mock_stat.side_effect = original_error
+        with patch("splurge_sql_runner.utils.file_io_adapter.Path") as mock_path:
+            mock_path.return_value.stat.side_effect = original_error
 
             with pytest.raises(SplurgeSqlRunnerFileError) as exc_info:
                 FileIoAdapter.validate_file_size(str(test_file))